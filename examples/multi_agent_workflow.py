@@ -9,9 +9,11 @@ This example demonstrates:
 """
 
 import asyncio
-from dataclasses import dataclass
+import re
+import sys
+from dataclasses import dataclass, fields
 
-from agent_infrastructure_platform import Agent, AgentCard, Orchestrator
+from agent_infrastructure_platform import Agent, AgentCard, Orchestrator, install_fast_loop
 from agent_infrastructure_platform.common.agent import AgentConfig
 from agent_infrastructure_platform.common.types import (
     Capability,
@@ -43,6 +45,14 @@ class WritingResult:
     word_count: int
 
 
+# Field names resolved once, so serializing a result is a flat copy with no
+# per-task dataclass introspection (and no aliasing of the instance __dict__)
+_RESEARCH_FIELDS = tuple(f.name for f in fields(ResearchResult))
+_WRITING_FIELDS = tuple(f.name for f in fields(WritingResult))
+
+_WORD_RE = re.compile(r"\S+")
+
+
 class ResearchAgent(Agent):
     """Agent that researches topics."""
     
@@ -73,7 +83,7 @@ class ResearchAgent(Agent):
             sources=["source1.com", "source2.com"],
         )
         
-        task.output_data = result.__dict__
+        task.output_data = {name: getattr(result, name) for name in _RESEARCH_FIELDS}
         return task
     
     async def handle_message(self, message, ctx):
@@ -103,17 +113,18 @@ class WritingAgent(Agent):
         # Simulate writing
         await asyncio.sleep(0.5)
         
-        content = f"# {topic.title()}\n\n"
-        for i, finding in enumerate(findings, 1):
-            content += f"{i}. {finding}\n\n"
+        content = "".join([
+            f"# {topic.title()}\n\n",
+            *(f"{i}. {finding}\n\n" for i, finding in enumerate(findings, 1)),
+        ])
         
         result = WritingResult(
             title=topic.title(),
             content=content,
-            word_count=len(content.split()),
+            word_count=sum(1 for _ in _WORD_RE.finditer(content)),
         )
         
-        task.output_data = result.__dict__
+        task.output_data = {name: getattr(result, name) for name in _WRITING_FIELDS}
         return task
     
     async def handle_message(self, message, ctx):
@@ -180,10 +191,12 @@ async def main():
     writing_agent = WritingAgent()
     review_agent = ReviewAgent()
     
-    # Initialize agents
-    await research_agent.initialize()
-    await writing_agent.initialize()
-    await review_agent.initialize()
+    # Initialize agents concurrently
+    await asyncio.gather(
+        research_agent.initialize(),
+        writing_agent.initialize(),
+        review_agent.initialize(),
+    )
     
     print(f"   - Research Agent: {research_agent.id}")
     print(f"     Capabilities: {[c.name for c in research_agent.list_capabilities()]}")
@@ -242,31 +255,37 @@ async def main():
     print("5. Executing workflow...")
     print()
     
-    results = await orchestrator.execute(plan)
-    
-    # 6. Display results
+    # 6. Display results as each task finishes
     print("6. Results:")
     print()
     
-    for task_id, result in results.items():
+    async for result in orchestrator.iter_execute(plan):
         status = "✓" if result.success else "✗"
-        print(f"   {status} Task {task_id[:20]}...")
-        print(f"     Success: {result.success}")
-        print(f"     Duration: {result.duration_ms:.2f}ms")
+        lines = [
+            f"   {status} Task {result.task_id[:20]}...\n",
+            f"     Success: {result.success}\n",
+            f"     Duration: {result.duration_ms:.2f}ms\n",
+        ]
         
         if result.output:
-            print(f"     Output: {str(result.output)[:100]}...")
+            lines.append(f"     Output: {str(result.output)[:100]}...\n")
         
         if result.error:
-            print(f"     Error: {result.error}")
-        print()
+            lines.append(f"     Error: {result.error}\n")
+        lines.append("\n")
+        
+        # One write per result rather than one per line
+        sys.stdout.writelines(lines)
+        sys.stdout.flush()
     
     # 7. Cleanup
     print("7. Cleaning up...")
     
-    await research_agent.shutdown()
-    await writing_agent.shutdown()
-    await review_agent.shutdown()
+    await asyncio.gather(
+        research_agent.shutdown(),
+        writing_agent.shutdown(),
+        review_agent.shutdown(),
+    )
     
     print("   - All agents shut down")
     print()
@@ -282,4 +301,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_fast_loop()
     asyncio.run(main())
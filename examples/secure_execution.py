@@ -9,6 +9,7 @@ Demonstrates:
 
 import asyncio
 
+from agent_infrastructure_platform import install_fast_loop
 from agent_infrastructure_platform.compute.runtime import AgentRuntime, ContainerConfig
 from agent_infrastructure_platform.compute.sandbox import Sandbox, SandboxConfig
 from agent_infrastructure_platform.compute.tee import TEERuntime, TEEConfig
@@ -39,7 +40,7 @@ output = {"input": data, "result": result}
 """
     
     print("\n1. Executing safe code...")
-    result = sandbox.execute(safe_code)
+    result = await sandbox.aexecute(safe_code)
     print(f"   Success: {result.success}")
     print(f"   Output: {result.result}")
     print(f"   Duration: {result.execution_time_ms:.2f}ms")
@@ -51,7 +52,7 @@ result = os.system("ls")
 """
     
     print("\n2. Executing code with security violation...")
-    result = sandbox.execute(bad_code)
+    result = await sandbox.aexecute(bad_code)
     print(f"   Success: {result.success}")
     print(f"   Error: {result.error}")
     print(f"   Security violations: {result.security_violations}")
@@ -64,10 +65,12 @@ result = "done"
 """
     
     print("\n3. Executing code that times out...")
-    result = sandbox.execute(slow_code)
+    result = await sandbox.aexecute(slow_code)
     print(f"   Success: {result.success}")
     print(f"   Error: {result.error}")
     print()
+    
+    await sandbox.close()
 
 
 async def tee_example():
@@ -90,9 +93,10 @@ async def tee_example():
 input_data = input_data or {}
 pii = input_data.get("pii", {})
 
-# Hash the sensitive data
+# Hash the sensitive data as canonical JSON bytes (key order independent)
 import hashlib
-hashed = hashlib.sha256(str(pii).encode()).hexdigest()
+import orjson
+hashed = hashlib.sha256(orjson.dumps(pii, option=orjson.OPT_SORT_KEYS)).hexdigest()
 
 output = {
     "hashed_pii": hashed,
@@ -143,6 +147,9 @@ async def container_example():
         read_only_root=True,
     )
     
+    # Start pulling the image while the rest of the example is set up
+    runtime.prefetch(config.image)
+    
     # Simple code to execute
     code = """
 import sys
@@ -189,4 +196,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_fast_loop()
     asyncio.run(main())
@@ -5,6 +5,10 @@ The operating system for the trillion-agent economy.
 Provides universal protocols, identity, memory, and governance for multi-agent systems.
 """
 
+import asyncio
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
 __all__ = [
     "Agent",
@@ -18,16 +22,68 @@ __all__ = [
     "Orchestrator",
     "PolicyEngine",
     "IdentityManager",
+    "install_fast_loop",
 ]
 
-from agent_infrastructure_platform.common.agent import Agent
-from agent_infrastructure_platform.identity.agent_card import AgentCard
-from agent_infrastructure_platform.protocols.mcp.client import MCPClient
-from agent_infrastructure_platform.protocols.mcp.server import MCPServer
-from agent_infrastructure_platform.protocols.a2a.protocol import A2AProtocol
-from agent_infrastructure_platform.protocols.acp.protocol import ACPProtocol
-from agent_infrastructure_platform.protocols.anp.protocol import ANPProtocol
-from agent_infrastructure_platform.memory.backend import MemoryBackend
-from agent_infrastructure_platform.orchestration.orchestrator import Orchestrator
-from agent_infrastructure_platform.governance.policy import PolicyEngine
-from agent_infrastructure_platform.identity.manager import IdentityManager
+if TYPE_CHECKING:
+    from agent_infrastructure_platform.common.agent import Agent
+    from agent_infrastructure_platform.identity.agent_card import AgentCard
+    from agent_infrastructure_platform.protocols.mcp.client import MCPClient
+    from agent_infrastructure_platform.protocols.mcp.server import MCPServer
+    from agent_infrastructure_platform.protocols.a2a.protocol import A2AProtocol
+    from agent_infrastructure_platform.protocols.acp.protocol import ACPProtocol
+    from agent_infrastructure_platform.protocols.anp.protocol import ANPProtocol
+    from agent_infrastructure_platform.memory.backend import MemoryBackend
+    from agent_infrastructure_platform.orchestration.orchestrator import Orchestrator
+    from agent_infrastructure_platform.governance.policy import PolicyEngine
+    from agent_infrastructure_platform.identity.manager import IdentityManager
+
+# Public names are imported on first access (PEP 562), so importing one
+# subsystem does not pull in every protocol stack
+_LAZY_IMPORTS = {
+    "Agent": "agent_infrastructure_platform.common.agent",
+    "AgentCard": "agent_infrastructure_platform.identity.agent_card",
+    "MCPClient": "agent_infrastructure_platform.protocols.mcp.client",
+    "MCPServer": "agent_infrastructure_platform.protocols.mcp.server",
+    "A2AProtocol": "agent_infrastructure_platform.protocols.a2a.protocol",
+    "ACPProtocol": "agent_infrastructure_platform.protocols.acp.protocol",
+    "ANPProtocol": "agent_infrastructure_platform.protocols.anp.protocol",
+    "MemoryBackend": "agent_infrastructure_platform.memory.backend",
+    "Orchestrator": "agent_infrastructure_platform.orchestration.orchestrator",
+    "PolicyEngine": "agent_infrastructure_platform.governance.policy",
+    "IdentityManager": "agent_infrastructure_platform.identity.manager",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+
+def install_fast_loop() -> bool:
+    """
+    Use uvloop for subsequently created event loops, if it is installed.
+    
+    Call before ``asyncio.run()``. Falls back silently to the default loop
+    when uvloop is unavailable (e.g. on Windows).
+    
+    Returns:
+        True if uvloop was installed
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import asyncio
+import secrets
+import sys
 from abc import ABC, abstractmethod
 from collections.abc import AsyncIterator, Awaitable, Callable
 from contextlib import asynccontextmanager
-from datetime import datetime
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
 from typing import Any
-from uuid import uuid4
 
 import structlog
 from pydantic import BaseModel, ConfigDict, Field
@@ -26,6 +28,7 @@ from agent_infrastructure_platform.common.types import (
     ProtocolType,
     SessionID,
     Task,
+    TaskStatus,
 )
 
 logger = structlog.get_logger()
@@ -53,10 +56,21 @@ class AgentConfig(BaseModel):
     # Retry settings
     max_retries: int = 3
     retry_base_delay: float = 1.0
+    
+    # Task batching (see AgentBatcher)
+    batch_max_size: int = 32
+    batch_max_wait_ms: float = 50.0
+    batch_concurrency: int = 4
 
 
-class AgentMetrics(BaseModel):
-    """Runtime metrics for an agent."""
+@dataclass(slots=True)
+class AgentMetrics:
+    """
+    Runtime metrics for an agent.
+    
+    A slotted dataclass rather than a model: counters are bumped on every
+    task and message, so attribute writes must stay cheap.
+    """
 
     tasks_completed: int = 0
     tasks_failed: int = 0
@@ -66,6 +80,134 @@ class AgentMetrics(BaseModel):
     last_active: datetime | None = None
     error_count: int = 0
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert metrics to a dictionary for serialization."""
+        return asdict(self)
+
+
+class AgentBatcher:
+    """
+    Groups task submissions for a single agent into batches.
+    
+    Submitted tasks are queued together with a future. Worker coroutines
+    drain up to ``max_batch`` tasks and hand them to ``Agent.handle_batch``
+    in one call, so per-request overhead of batching backends (e.g. LLM
+    endpoints) is amortized across the batch. A batch is dispatched as soon
+    as the queue goes idle, so a lone task is not delayed; while tasks keep
+    arriving it stays open for at most ``max_wait_ms``.
+    
+    The queue holds at most ``max_pending`` tasks (by default four full
+    rounds of batches); beyond that ``submit`` waits, so a burst of
+    submissions is throttled to what the agent can drain.
+    
+    Example:
+        ```python
+        batcher = AgentBatcher(agent, max_batch=16, max_wait_ms=20)
+        result = await batcher.submit(task, ctx)
+        await batcher.close()
+        ```
+    """
+
+    def __init__(
+        self,
+        agent: Agent,
+        max_batch: int = 32,
+        max_wait_ms: float = 50.0,
+        concurrency: int = 4,
+        max_pending: int | None = None,
+    ) -> None:
+        self.agent = agent
+        self.max_batch = max_batch
+        self.max_wait_ms = max_wait_ms
+        self.concurrency = concurrency
+        self.max_pending = max_pending or max_batch * concurrency * 4
+        
+        self._queue: asyncio.Queue[tuple[Task, Context, asyncio.Future[Task]]] = asyncio.Queue(
+            maxsize=self.max_pending
+        )
+        self._workers: list[asyncio.Task[None]] = []
+        self._closed = False
+    
+    def start(self) -> None:
+        """Start the batch workers if they are not running yet."""
+        if not self._workers:
+            self._workers = [
+                asyncio.create_task(self.run()) for _ in range(self.concurrency)
+            ]
+    
+    async def submit(self, task: Task, ctx: Context) -> Task:
+        """Queue a task for batched execution and wait for its result."""
+        if self._closed:
+            raise AgentUnavailableError("Agent batcher closed")
+        
+        self.start()
+        future: asyncio.Future[Task] = asyncio.get_running_loop().create_future()
+        await self._queue.put((task, ctx, future))
+        
+        # Closed while we waited for queue space: nothing will drain it
+        if self._closed and not future.done():
+            future.set_exception(AgentUnavailableError("Agent batcher closed"))
+        return await future
+    
+    async def run(self) -> None:
+        """Worker loop: collect batches and dispatch them to the agent."""
+        batch: list[tuple[Task, Context, asyncio.Future[Task]]] = []
+        try:
+            while True:
+                batch = []
+                await self._collect(batch)
+                tasks = [task for task, _, _ in batch]
+                contexts = [ctx for _, ctx, _ in batch]
+                
+                try:
+                    results: list[Task | BaseException] = await self.agent.handle_batch(
+                        tasks, contexts
+                    )
+                    # A handle_batch returning the wrong count fails every task
+                    outcomes = list(zip(batch, results, strict=True))
+                except Exception as e:
+                    outcomes = [(entry, e) for entry in batch]
+                
+                for (_, _, future), result in outcomes:
+                    if future.done():  # Submitter gave up (cancelled or timed out)
+                        continue
+                    if isinstance(result, BaseException):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+        finally:
+            # Stopped mid-batch: tasks already taken off the queue get no result
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(AgentUnavailableError("Agent batcher closed"))
+    
+    async def _collect(self, batch: list[tuple[Task, Context, asyncio.Future[Task]]]) -> None:
+        """Wait for one task, then add more until the queue goes idle or the batch is full."""
+        batch.append(await self._queue.get())
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_wait_ms / 1000
+        
+        while len(batch) < self.max_batch and loop.time() < deadline:
+            if self._queue.empty():
+                # One loop turn lets submitters that are already running enqueue
+                await asyncio.sleep(0)
+                if self._queue.empty():
+                    break
+            batch.append(self._queue.get_nowait())
+    
+    async def close(self) -> None:
+        """Stop the workers and fail any tasks still waiting in the queue."""
+        self._closed = True
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        
+        while not self._queue.empty():
+            _, _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(AgentUnavailableError("Agent batcher closed"))
+
 
 class Agent(ABC):
     """
@@ -97,18 +239,26 @@ class Agent(ABC):
 
     def __init__(self, config: AgentConfig) -> None:
         self.config = config
-        self.id = AgentID(f"{config.name}-{uuid4().hex[:8]}")
+        self.id = AgentID(f"{config.name}-{secrets.token_hex(4)}")
         self.state = AgentState.INITIALIZING
         self.capabilities: dict[str, Capability] = {}
+        self._capability_list: tuple[Capability, ...] | None = None
+        self._capability_names: frozenset[str] | None = None
         self.metrics = AgentMetrics()
         
         # Task management
         self._active_tasks: dict[str, Task] = {}
+        self._running_tasks: dict[str, asyncio.Task[Any]] = {}  # asyncio task per active task
         self._task_semaphore = asyncio.Semaphore(config.max_concurrent_tasks)
         self._task_handlers: dict[str, Callable[[Task, Context], Awaitable[Task]]] = {}
         
         # Message handling
-        self._message_handlers: dict[str, Callable[[Message, Context], Awaitable[Message | None]]] = {}
+        self._message_handlers: dict[
+            MessageType, Callable[[Message, Context], Awaitable[Message | None]]
+        ] = {}
+        
+        # Batched submission (created lazily on first submit)
+        self._batcher: AgentBatcher | None = None
         
         # Background tasks
         self._health_check_task: asyncio.Task[None] | None = None
@@ -135,26 +285,34 @@ class Agent(ABC):
         self.state = AgentState.SHUTTING_DOWN
         self._shutdown_event.set()
         
-        # Cancel active tasks
-        if self._active_tasks:
-            self._logger.warning(
-                "cancelling_active_tasks",
-                count=len(self._active_tasks),
-            )
-            for task in self._active_tasks.values():
-                # Signal cancellation (actual implementation depends on task structure)
-                pass
+        # Cancel active tasks together and wait for them to unwind
+        current = asyncio.current_task()
+        pending = [t for t in self._running_tasks.values() if t is not current]
+        if pending:
+            self._logger.warning("cancelling_active_tasks", count=len(pending))
+            for running in pending:
+                running.cancel()
+            try:
+                async with asyncio.timeout(timeout):
+                    await asyncio.gather(*pending, return_exceptions=True)
+            except TimeoutError:
+                self._logger.warning(
+                    "active_tasks_not_drained",
+                    count=sum(not t.done() for t in pending),
+                )
+        
+        # Stop batch workers
+        if self._batcher:
+            await self._batcher.close()
+            self._batcher = None
         
-        # Wait for health check to stop
+        # Stop health checks; the loop only wakes once per interval
         if self._health_check_task:
+            self._health_check_task.cancel()
             try:
-                await asyncio.wait_for(self._health_check_task, timeout=timeout)
-            except asyncio.TimeoutError:
-                self._health_check_task.cancel()
-                try:
-                    await self._health_check_task
-                except asyncio.CancelledError:
-                    pass
+                await self._health_check_task
+            except asyncio.CancelledError:
+                pass
         
         self.state = AgentState.OFFLINE
         self._logger.info("agent_shutdown_complete")
@@ -175,21 +333,37 @@ class Agent(ABC):
     def register_capability(self, capability: Capability) -> None:
         """Register a capability this agent can provide."""
         self.capabilities[capability.name] = capability
+        self._invalidate_capabilities()
         self._logger.debug("capability_registered", capability=capability.name)
     
     def unregister_capability(self, name: str) -> None:
         """Unregister a capability."""
         if name in self.capabilities:
             del self.capabilities[name]
+            self._invalidate_capabilities()
             self._logger.debug("capability_unregistered", capability=name)
     
+    def _invalidate_capabilities(self) -> None:
+        """Drop cached capability views after registration changes."""
+        self._capability_list = None
+        self._capability_names = None
+    
     def has_capability(self, name: str) -> bool:
         """Check if agent has a specific capability."""
         return name in self.capabilities
     
-    def list_capabilities(self) -> list[Capability]:
-        """List all registered capabilities."""
-        return list(self.capabilities.values())
+    def list_capabilities(self) -> tuple[Capability, ...]:
+        """List all registered capabilities (cached until registration changes)."""
+        if self._capability_list is None:
+            self._capability_list = tuple(self.capabilities.values())
+        return self._capability_list
+    
+    @property
+    def capability_names(self) -> frozenset[str]:
+        """Names of all registered capabilities (cached until registration changes)."""
+        if self._capability_names is None:
+            self._capability_names = frozenset(self.capabilities)
+        return self._capability_names
     
     #endregion
     
@@ -215,7 +389,8 @@ class Agent(ABC):
         handler: Callable[[Task, Context], Awaitable[Task]],
     ) -> None:
         """Register a handler for a specific task type."""
-        self._task_handlers[task_type] = handler
+        # Interned so lookups by task name can short-circuit on identity
+        self._task_handlers[sys.intern(task_type)] = handler
     
     @trace_span()
     async def execute_task(self, task: Task, ctx: Context | None = None) -> Task:
@@ -224,7 +399,7 @@ class Agent(ABC):
         
         Args:
             task: The task to execute
-            ctx: Optional execution context
+            ctx: Optional execution context (defaults to ``Context.current()``)
             
         Returns:
             The completed task
@@ -232,63 +407,129 @@ class Agent(ABC):
         if self.state not in (AgentState.IDLE, AgentState.BUSY):
             raise AgentUnavailableError(f"Agent is {self.state.value}")
         
-        ctx = ctx or Context()
+        ctx = ctx or Context.current()
+        
+        # Read the wall clock once; later timestamps are derived from loop time
+        loop = asyncio.get_running_loop()
+        started_mono = loop.time()
+        started_wall = datetime.utcnow()
+        
         task.assigned_to = self.id
-        task.started_at = datetime.utcnow()
+        task.started_at = started_wall
         self._active_tasks[task.id] = task
+        self._running_tasks[task.id] = asyncio.current_task()
         
-        self._logger.info(
-            "task_starting",
-            task_id=task.id,
-            task_name=task.name,
-        )
-        
-        async with self._task_semaphore:
-            self.state = AgentState.BUSY
-            start_time = asyncio.get_event_loop().time()
+        # Registered before waiting for a slot so shutdown also reaches queued
+        # tasks; the outer finally unregisters however the task ends
+        try:
+            # Per-task events are debug level: with structlog's level filtering
+            # they compile to no-ops, keeping logging off the task hot path
+            self._logger.debug(
+                "task_starting",
+                task_id=task.id,
+                task_name=task.name,
+            )
             
-            try:
-                # Check for specific handler
-                handler = self._task_handlers.get(task.name)
-                if handler:
-                    result = await handler(task, ctx)
-                else:
-                    result = await self.handle_task(task, ctx)
+            async with self._task_semaphore:
+                self.state = AgentState.BUSY
+                start_time = loop.time()
                 
-                result.status = TaskStatus.COMPLETED
-                self.metrics.tasks_completed += 1
+                try:
+                    # Check for specific handler
+                    handler = self._task_handlers.get(task.name)
+                    with ctx.bind():
+                        if handler:
+                            result = await handler(task, ctx)
+                        else:
+                            result = await self.handle_task(task, ctx)
+                    
+                    result.status = TaskStatus.COMPLETED
+                    self.metrics.tasks_completed += 1
+                    
+                except Exception as e:
+                    self._logger.error(
+                        "task_failed",
+                        task_id=task.id,
+                        error=str(e),
+                    )
+                    task.status = TaskStatus.FAILED
+                    task.output_data = {"error": str(e)}
+                    self.metrics.tasks_failed += 1
+                    self.metrics.error_count += 1
+                    raise
                 
-            except Exception as e:
-                self._logger.error(
-                    "task_failed",
-                    task_id=task.id,
-                    error=str(e),
-                )
-                task.status = TaskStatus.FAILED
-                task.output_data = {"error": str(e)}
-                self.metrics.tasks_failed += 1
-                self.metrics.error_count += 1
-                raise
+                finally:
+                    end_time = loop.time()
+                    duration = (end_time - start_time) * 1000
+                    completed_wall = started_wall + timedelta(seconds=end_time - started_mono)
+                    self.metrics.total_execution_time_ms += duration
+                    self.metrics.last_active = completed_wall
+                    
+                    task.completed_at = completed_wall
+                    self._logger.debug(
+                        "task_completed",
+                        task_id=task.id,
+                        status=task.status.value,
+                        duration_ms=duration,
+                    )
+        
+        except asyncio.CancelledError:
+            task.status = TaskStatus.CANCELLED
+            raise
+        
+        finally:
+            del self._active_tasks[task.id]
+            del self._running_tasks[task.id]
             
-            finally:
-                duration = (asyncio.get_event_loop().time() - start_time) * 1000
-                self.metrics.total_execution_time_ms += duration
-                self.metrics.last_active = datetime.utcnow()
-                del self._active_tasks[task.id]
-                
-                if not self._active_tasks:
-                    self.state = AgentState.IDLE
-                
-                task.completed_at = datetime.utcnow()
-                self._logger.info(
-                    "task_completed",
-                    task_id=task.id,
-                    status=result.status.value,
-                    duration_ms=duration,
-                )
+            if not self._active_tasks:
+                self.state = AgentState.IDLE
         
         return result
     
+    async def handle_batch(
+        self,
+        tasks: list[Task],
+        contexts: list[Context],
+    ) -> list[Task | BaseException]:
+        """
+        Handle a batch of tasks collected by the AgentBatcher.
+        
+        The default implementation executes each task individually and
+        concurrently. Override to forward the whole batch to a backend
+        that supports batched requests.
+        
+        Args:
+            tasks: Tasks in submission order
+            contexts: Execution context for each task
+            
+        Returns:
+            Completed task or raised exception for each input, in order
+        """
+        return await asyncio.gather(
+            *(self.execute_task(task, ctx) for task, ctx in zip(tasks, contexts, strict=True)),
+            return_exceptions=True,
+        )
+    
+    async def submit(self, task: Task, ctx: Context | None = None) -> Task:
+        """
+        Submit a task for batched execution.
+        
+        Args:
+            task: The task to execute
+            ctx: Optional execution context (defaults to ``Context.current()``)
+            
+        Returns:
+            The completed task
+        """
+        if self._batcher is None:
+            self._batcher = AgentBatcher(
+                self,
+                max_batch=self.config.batch_max_size,
+                max_wait_ms=self.config.batch_max_wait_ms,
+                concurrency=self.config.batch_concurrency,
+            )
+        return await self._batcher.submit(task, ctx or Context.current())
+    
     #endregion
     
     #region Message Handling
@@ -309,11 +550,11 @@ class Agent(ABC):
     
     def register_message_handler(
         self,
-        message_type: str,
+        message_type: MessageType | str,
         handler: Callable[[Message, Context], Awaitable[Message | None]],
     ) -> None:
         """Register a handler for a specific message type."""
-        self._message_handlers[message_type] = handler
+        self._message_handlers[MessageType(message_type)] = handler
     
     async def send_message(
         self,
@@ -365,7 +606,7 @@ class Agent(ABC):
         )
         
         # Check for specific handler
-        handler = self._message_handlers.get(message.type.value)
+        handler = self._message_handlers.get(message.type)
         if handler:
             return await handler(message, ctx)
         
@@ -406,20 +647,20 @@ class Agent(ABC):
     
     async def _health_check_loop(self) -> None:
         """Background task for periodic health checks."""
-        while not self._shutdown_event.is_set():
-            try:
-                await asyncio.wait_for(
-                    self._shutdown_event.wait(),
-                    timeout=self.config.health_check_interval_seconds,
+        # A plain sleep rather than a timed wait on the shutdown event, which
+        # raised and caught TimeoutError every interval; shutdown() cancels us
+        while True:
+            await asyncio.sleep(self.config.health_check_interval_seconds)
+            if self._shutdown_event.is_set():
+                break
+            
+            health = await self.health_check()
+            if health.status != "healthy":
+                self._logger.warning(
+                    "health_check_degraded",
+                    status=health.status,
+                    checks=health.checks,
                 )
-            except asyncio.TimeoutError:
-                health = await self.health_check()
-                if health.status != "healthy":
-                    self._logger.warning(
-                        "health_check_degraded",
-                        status=health.status,
-                        checks=health.checks,
-                    )
     
     def get_metrics(self) -> AgentMetrics:
         """Get current metrics."""
@@ -4,25 +4,45 @@ from __future__ import annotations
 
 import asyncio
 import functools
+import threading
 import time
-from collections.abc import Awaitable, Callable
-from typing import Any, ParamSpec, TypeVar
+from collections import OrderedDict, defaultdict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar
 
 import structlog
 from tenacity import (
-    retry,
+    AsyncRetrying,
+    RetryCallState,
     retry_if_exception_type,
     stop_after_attempt,
-    wait_exponential,
+    wait_exponential_jitter,
 )
 
 from agent_infrastructure_platform.common.exceptions import RetryExhaustedError
 
+if TYPE_CHECKING:
+    from opentelemetry.trace import Tracer
+
 logger = structlog.get_logger()
 
 P = ParamSpec("P")
 T = TypeVar("T")
 
+# Inserts between sweeps of expired cache_result entries
+_CACHE_SWEEP_INTERVAL = 256
+
+
+async def _sleep(delay: float) -> None:
+    """Sleep on a bare loop timer; cheaper than asyncio.sleep for retry delays."""
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    handle = loop.call_later(delay, future.set_result, None)
+    try:
+        await future
+    finally:
+        handle.cancel()
+
 
 def retry_with_backoff(
     max_attempts: int = 3,
@@ -33,6 +53,9 @@ def retry_with_backoff(
     """
     Retry decorator with exponential backoff for async functions.
     
+    Delays are jittered so that callers failing together do not retry in
+    lockstep.
+    
     Args:
         max_attempts: Maximum number of retry attempts
         base_delay: Initial delay between retries (seconds)
@@ -41,42 +64,58 @@ def retry_with_backoff(
     """
 
     def decorator(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+        def log_retry(retry_state: RetryCallState) -> None:
+            logger.warning(
+                "retry_attempt",
+                func=func.__name__,
+                attempt=retry_state.attempt_number,
+                max_attempts=max_attempts,
+                delay=retry_state.upcoming_sleep,
+                error=str(retry_state.outcome.exception()),
+            )
+        
+        retrying = AsyncRetrying(
+            stop=stop_after_attempt(max_attempts),
+            wait=wait_exponential_jitter(initial=base_delay, max=max_delay, jitter=base_delay),
+            retry=retry_if_exception_type(exceptions),
+            before_sleep=log_retry,
+            sleep=_sleep,
+            reraise=True,
+        )
+        
         @functools.wraps(func)
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-            attempt = 0
-            last_exception: Exception | None = None
-            
-            while attempt < max_attempts:
-                try:
-                    return await func(*args, **kwargs)
-                except exceptions as e:
-                    attempt += 1
-                    last_exception = e
-                    
-                    if attempt >= max_attempts:
-                        break
-                    
-                    delay = min(base_delay * (2 ** (attempt - 1)), max_delay)
-                    logger.warning(
-                        "retry_attempt",
-                        func=func.__name__,
-                        attempt=attempt,
-                        max_attempts=max_attempts,
-                        delay=delay,
-                        error=str(e),
-                    )
-                    await asyncio.sleep(delay)
-            
-            raise RetryExhaustedError(
-                f"All {max_attempts} retry attempts exhausted for {func.__name__}",
-                cause=last_exception,
-            )
+            # Attempts run inline in this frame rather than through a second
+            # tenacity wrapper; each call gets its own copy of the retry state
+            try:
+                async for attempt in retrying.copy():
+                    with attempt:
+                        return await func(*args, **kwargs)
+            except exceptions as e:
+                raise RetryExhaustedError(
+                    f"All {max_attempts} retry attempts exhausted for {func.__name__}",
+                    cause=e,
+                ) from e
         
         return wrapper
     
     return decorator
 
 
+_tracer: Tracer | None = None
+
+
+def _get_tracer() -> Tracer:
+    """Import OpenTelemetry and create the module tracer on first use."""
+    global _tracer
+    if _tracer is None:
+        import opentelemetry.trace
+        
+        # A proxy tracer that follows whichever provider is configured later
+        _tracer = opentelemetry.trace.get_tracer(__name__)
+    return _tracer
+
+
 def trace_span(
     operation_name: str | None = None,
     tags: dict[str, str] | None = None,
@@ -90,23 +129,19 @@ def trace_span(
     """
 
     def decorator(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+        # Span name and static attributes are fixed at decoration time
+        span_name = operation_name or func.__name__
+        attributes = {
+            "function.name": func.__name__,
+            "function.module": func.__module__,
+            **(tags or {}),
+        }
+        
         @functools.wraps(func)
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-            import opentelemetry.trace
-            
-            tracer = opentelemetry.trace.get_tracer(__name__)
-            span_name = operation_name or func.__name__
+            tracer = _tracer or _get_tracer()
             
-            with tracer.start_as_current_span(span_name) as span:
-                # Add default tags
-                span.set_attribute("function.name", func.__name__)
-                span.set_attribute("function.module", func.__module__)
-                
-                # Add custom tags
-                if tags:
-                    for key, value in tags.items():
-                        span.set_attribute(key, value)
-                
+            with tracer.start_as_current_span(span_name, attributes=attributes) as span:
                 try:
                     result = await func(*args, **kwargs)
                     span.set_attribute("success", True)
@@ -124,36 +159,47 @@ def trace_span(
 
 
 class RateLimiter:
-    """Token bucket rate limiter."""
+    """
+    Token bucket rate limiter.
+    
+    Refilling and taking tokens never awaits, so under the event loop it is
+    atomic without a lock. Waiters sleep until the deficit refills instead
+    of polling.
+    """
     
     def __init__(
         self,
         rate: float,  # tokens per second
         burst: int,   # maximum bucket size
     ) -> None:
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
         self.rate = rate
         self.burst = burst
         self.tokens = burst
         self.last_update = time.monotonic()
-        self._lock = asyncio.Lock()
+    
+    def _try_acquire(self, tokens: int) -> bool:
+        """Refill the bucket and take tokens if enough are available."""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.last_update) * self.rate)
+        self.last_update = now
+        
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return True
+        return False
     
     async def acquire(self, tokens: int = 1) -> bool:
         """Try to acquire tokens from the bucket."""
-        async with self._lock:
-            now = time.monotonic()
-            elapsed = now - self.last_update
-            self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
-            self.last_update = now
-            
-            if self.tokens >= tokens:
-                self.tokens -= tokens
-                return True
-            return False
+        return self._try_acquire(tokens)
     
     async def wait(self, tokens: int = 1) -> None:
         """Wait until tokens are available."""
-        while not await self.acquire(tokens):
-            await asyncio.sleep(0.01)
+        if tokens > self.burst:
+            raise ValueError(f"Cannot wait for {tokens} tokens; bucket holds at most {self.burst}")
+        while not self._try_acquire(tokens):
+            await asyncio.sleep((tokens - self.tokens) / self.rate)
 
 
 def rate_limit(
@@ -169,24 +215,16 @@ def rate_limit(
         burst: Maximum bucket size
         key_func: Function to extract rate limit key from arguments
     """
-    limiters: dict[str, RateLimiter] = {}
+    # Limiters are created on first use of a key
+    limiters: defaultdict[str, RateLimiter] = defaultdict(lambda: RateLimiter(rate, burst))
     
     def decorator(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
         @functools.wraps(func)
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-            # Determine rate limit key
-            if key_func:
-                key = key_func(*args, **kwargs)
-            else:
-                key = "default"
-            
-            # Get or create limiter
-            if key not in limiters:
-                limiters[key] = RateLimiter(rate, burst)
-            limiter = limiters[key]
+            key = key_func(*args, **kwargs) if key_func else "default"
             
             # Wait for rate limit
-            await limiter.wait()
+            await limiters[key].wait()
             
             return await func(*args, **kwargs)
         
@@ -198,35 +236,56 @@ def rate_limit(
 def cache_result(
     ttl_seconds: float,
     key_func: Callable[[Any], str] | None = None,
+    maxsize: int = 1024,
 ) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
     """
-    Simple in-memory cache decorator for async functions.
+    Simple in-memory LRU cache decorator for async functions.
     
     Args:
         ttl_seconds: Cache TTL in seconds
         key_func: Function to generate cache key from arguments
+        maxsize: Maximum number of cached results
     """
-    cache: dict[str, tuple[T, float]] = {}
+    cache: OrderedDict[Hashable, tuple[T, float]] = OrderedDict()
+    inserts = 0
     
     def decorator(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
         @functools.wraps(func)
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            nonlocal inserts
+            
             # Generate cache key
             if key_func:
-                key = key_func(*args, **kwargs)
+                key: Hashable = key_func(*args, **kwargs)
             else:
-                key = f"{func.__name__}:{hash(str(args) + str(kwargs))}"
+                key = (func, args, tuple(sorted(kwargs.items())))
+                try:
+                    hash(key)
+                except TypeError:
+                    # Unhashable arguments: fall back to their string form
+                    key = f"{func.__qualname__}:{args!s}{kwargs!s}"
             
             # Check cache
             now = time.monotonic()
-            if key in cache:
-                result, expiry = cache[key]
-                if now < expiry:
-                    return result
+            entry = cache.get(key)
+            if entry is not None:
+                if now < entry[1]:
+                    cache.move_to_end(key)
+                    return entry[0]
+                del cache[key]
             
             # Execute and cache
             result = await func(*args, **kwargs)
             cache[key] = (result, now + ttl_seconds)
+            if len(cache) > maxsize:
+                cache.popitem(last=False)
+            
+            # Periodically drop expired entries so stale results are not retained
+            inserts += 1
+            if inserts % _CACHE_SWEEP_INTERVAL == 0:
+                for stale in [k for k, (_, expiry) in cache.items() if expiry <= now]:
+                    del cache[stale]
+            
             return result
         
         return wrapper
@@ -236,13 +295,18 @@ def cache_result(
 
 def singleton[T](cls: type[T]) -> type[T]:
     """Singleton decorator for classes."""
-    instances: dict[type[T], T] = {}
+    instance: T | None = None
+    lock = threading.Lock()
     
     @functools.wraps(cls)
     def wrapper(*args: Any, **kwargs: Any) -> T:
-        if cls not in instances:
-            instances[cls] = cls(*args, **kwargs)
-        return instances[cls]
+        nonlocal instance
+        if instance is None:
+            # Only first construction is locked, in case of racing threads
+            with lock:
+                if instance is None:
+                    instance = cls(*args, **kwargs)
+        return instance
     
     return wrapper  # type: ignore[return-value]
 
@@ -254,9 +318,9 @@ def measure_time[
     
     @functools.wraps(func)
     async def wrapper(*args: P.args, **kwargs: P.kwargs) -> tuple[T, float]:
-        start = time.perf_counter()
+        # Integer nanoseconds keep full precision however long the process has run
+        start = time.perf_counter_ns()
         result = await func(*args, **kwargs)
-        duration = (time.perf_counter() - start) * 1000
-        return result, duration
+        return result, (time.perf_counter_ns() - start) / 1_000_000
     
     return wrapper
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum, StrEnum
+from secrets import token_hex
 from typing import (
+    Annotated,
     Any,
     AsyncIterator,
     Awaitable,
@@ -16,9 +22,8 @@ from typing import (
     NotRequired,
     TypedDict,
 )
-from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
 
 # Primitive Types
 AgentID = NewType("AgentID", str)
@@ -79,7 +84,10 @@ class Capability(BaseModel):
 
     model_config = ConfigDict(frozen=True)
 
-    name: str = Field(..., description="Unique capability identifier")
+    # Checked and lowercased inside pydantic-core, without a Python validator call
+    name: Annotated[
+        str, StringConstraints(to_lower=True, pattern=r"^[^/ ]+$")
+    ] = Field(..., description="Unique capability identifier")
     category: CapabilityCategory
     version: str = Field(default="1.0.0", pattern=r"^\d+\.\d+\.\d+$")
     description: str = ""
@@ -88,13 +96,6 @@ class Capability(BaseModel):
     requires_auth: bool = False
     rate_limit: int | None = None  # requests per minute
 
-    @field_validator("name")
-    @classmethod
-    def validate_name(cls, v: str) -> str:
-        if not v or "/" in v or " " in v:
-            raise ValueError("Capability name must be non-empty and not contain '/' or spaces")
-        return v.lower()
-
 
 class ResourceType(StrEnum):
     """Types of resources agents can access."""
@@ -112,7 +113,11 @@ class Resource(BaseModel):
 
     model_config = ConfigDict(frozen=True)
 
-    uri: str = Field(..., description="Unique resource identifier (URI)")
+    uri: str = Field(
+        ...,
+        description="Unique resource identifier (URI)",
+        pattern=r"^(file|db|api|memory|compute)://",
+    )
     type: ResourceType
     name: str
     description: str = ""
@@ -120,13 +125,6 @@ class Resource(BaseModel):
     metadata: dict[str, Any] = Field(default_factory=dict)
     size: int | None = None
 
-    @field_validator("uri")
-    @classmethod
-    def validate_uri(cls, v: str) -> str:
-        if not v.startswith(("file://", "db://", "api://", "memory://", "compute://")):
-            raise ValueError("URI must use a supported scheme")
-        return v
-
 
 class Tool(BaseModel):
     """A tool that can be invoked via MCP."""
@@ -136,9 +134,10 @@ class Tool(BaseModel):
     name: str
     description: str
     parameters: dict[str, Any] = Field(default_factory=dict)
-    required_params: list[str] = Field(default_factory=list)
+    # Tuples on this frozen model: lists are coerced, and the empty default is shared
+    required_params: tuple[str, ...] = ()
     returns: dict[str, Any] | None = None
-    examples: list[dict[str, Any]] = Field(default_factory=list)
+    examples: tuple[dict[str, Any], ...] = ()
 
 
 class TaskPriority(Enum):
@@ -151,12 +150,14 @@ class TaskPriority(Enum):
     BACKGROUND = 4
 
 
-class Task(BaseModel):
+# Task, Message, Context and HealthStatus are built by trusted internal code on
+# every task, message and hop, so they are slotted dataclasses rather than
+# validated models. Types that cross a protocol boundary stay Pydantic models.
+@dataclass(slots=True, kw_only=True)
+class Task:
     """A unit of work to be executed by an agent or agent team."""
 
-    model_config = ConfigDict(frozen=False)
-
-    id: TaskID = Field(default_factory=lambda: TaskID(str(UUID.uuid4())))
+    id: TaskID = field(default_factory=lambda: TaskID(token_hex(16)))
     parent_id: TaskID | None = None
     session_id: SessionID | None = None
 
@@ -171,35 +172,34 @@ class Task(BaseModel):
 
     # Execution state
     status: TaskStatus = TaskStatus.PENDING
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=datetime.utcnow)
     started_at: datetime | None = None
     completed_at: datetime | None = None
 
     # Assignment
     assigned_to: AgentID | None = None
-    required_capabilities: list[Capability] = Field(default_factory=list)
+    required_capabilities: list[Capability] = field(default_factory=list)
 
     # Context and results
     input_data: JSON = None
     output_data: JSON = None
-    context: dict[str, Any] = Field(default_factory=dict)
-    artifacts: list[str] = Field(default_factory=list)  # URIs to artifacts
+    context: dict[str, Any] = field(default_factory=dict)
+    artifacts: list[str] = field(default_factory=list)  # URIs to artifacts
 
     # Metadata
-    tags: list[str] = Field(default_factory=list)
-    metadata: dict[str, Any] = Field(default_factory=dict)
+    tags: list[str] = field(default_factory=list)
+    metadata: dict[str, Any] = field(default_factory=dict)
 
     # Cost tracking
     estimated_cost: Decimal | None = None
     actual_cost: Decimal | None = None
 
 
-class Message(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Message:
     """A message exchanged between agents."""
 
-    model_config = ConfigDict(frozen=True)
-
-    id: MessageID = Field(default_factory=lambda: MessageID(str(UUID.uuid4())))
+    id: MessageID = field(default_factory=lambda: MessageID(token_hex(16)))
     type: MessageType
     protocol: ProtocolType
 
@@ -215,7 +215,7 @@ class Message(BaseModel):
     encoding: str = "utf-8"
 
     # Metadata
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = field(default_factory=datetime.utcnow)
     ttl_seconds: int | None = None  # Time-to-live
     priority: int = 5  # 1-10, lower is higher priority
 
@@ -229,10 +229,14 @@ class Message(BaseModel):
     parent_span_id: str | None = None
 
 
-class Context(BaseModel):
-    """Execution context passed through agent operations."""
+# Context bound to the operation currently running; asyncio copies it into
+# every task created beneath, so it follows the call tree across awaits
+_current_context: ContextVar[Context | None] = ContextVar("aip_context", default=None)
 
-    model_config = ConfigDict(frozen=False)
+
+@dataclass(slots=True, kw_only=True)
+class Context:
+    """Execution context passed through agent operations."""
 
     # Identity
     caller: AgentID | None = None
@@ -240,7 +244,7 @@ class Context(BaseModel):
 
     # Security
     auth_token: str | None = None
-    permissions: list[str] = Field(default_factory=list)
+    permissions: list[str] = field(default_factory=list)
     clearance_level: int = 0
 
     # Tracing
@@ -258,21 +262,29 @@ class Context(BaseModel):
     version: str | None = None
 
     # Custom context
-    baggage: dict[str, str] = Field(default_factory=dict)
+    baggage: dict[str, str] = field(default_factory=dict)
 
     def with_agent(self, agent_id: AgentID) -> Context:
         """Create a new context with the specified agent as caller."""
-        new_ctx = self.model_copy()
-        new_ctx.caller = agent_id
-        return new_ctx
+        return replace(self, caller=agent_id)
 
     def with_trace(self, trace_id: str, span_id: str) -> Context:
         """Create a new context with updated trace info."""
-        new_ctx = self.model_copy()
-        new_ctx.trace_id = trace_id
-        new_ctx.span_id = span_id
-        new_ctx.parent_span_id = self.span_id
-        return new_ctx
+        return replace(self, trace_id=trace_id, span_id=span_id, parent_span_id=self.span_id)
+
+    @classmethod
+    def current(cls) -> Context:
+        """Get the context bound to the running operation, or a default one."""
+        return _current_context.get() or cls()
+
+    @contextmanager
+    def bind(self) -> Iterator[Context]:
+        """Make this the current context for the duration of the block."""
+        token = _current_context.set(self)
+        try:
+            yield self
+        finally:
+            _current_context.reset(token)
 
 
 class AgentState(Enum):
@@ -287,13 +299,14 @@ class AgentState(Enum):
     ERROR = "error"
 
 
-class HealthStatus(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class HealthStatus:
     """Health check information for an agent or service."""
 
     status: Literal["healthy", "degraded", "unhealthy", "unknown"]
-    last_check: datetime = Field(default_factory=datetime.utcnow)
-    checks: dict[str, bool] = Field(default_factory=dict)
-    metrics: dict[str, float] = Field(default_factory=dict)
+    last_check: datetime = field(default_factory=datetime.utcnow)
+    checks: dict[str, bool] = field(default_factory=dict)
+    metrics: dict[str, float] = field(default_factory=dict)
     message: str = ""
 
 
@@ -3,7 +3,6 @@
 from agent_infrastructure_platform.compute.runtime import AgentRuntime, ContainerConfig
 from agent_infrastructure_platform.compute.sandbox import Sandbox, SandboxConfig
 from agent_infrastructure_platform.compute.tee import TEERuntime, TEEConfig
-from agent_infrastructure_platform.compute.serverless import ServerlessExecutor
 
 __all__ = [
     "AgentRuntime",
@@ -12,5 +11,4 @@ __all__ = [
     "SandboxConfig",
     "TEERuntime",
     "TEEConfig",
-    "ServerlessExecutor",
 ]
@@ -3,16 +3,20 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import hashlib
-import json
 import os
+import shutil
 import subprocess
 import tempfile
-from dataclasses import dataclass, field
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any, AsyncIterator
 from uuid import uuid4
 
+import orjson
 import structlog
 
 from agent_infrastructure_platform.common.types import AgentID
@@ -107,15 +111,20 @@ class AgentRuntime:
         self,
         default_config: ContainerConfig | None = None,
         work_dir: str | None = None,
+        max_execution_logs: int = 10_000,
     ) -> None:
         self.default_config = default_config or ContainerConfig()
         self.work_dir = work_dir or tempfile.gettempdir()
+        self.max_execution_logs = max_execution_logs
         
         # Track running containers
         self._containers: dict[str, subprocess.Popen] = {}
         
-        # Execution cache for verification
-        self._execution_logs: dict[str, dict[str, Any]] = {}
+        # Execution cache for verification, oldest first
+        self._execution_logs: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        
+        # In-progress and finished image pulls, keyed by image
+        self._pulls: dict[str, asyncio.Task[bool]] = {}
         
         self._logger = logger
     
@@ -141,6 +150,11 @@ class AgentRuntime:
         config = config or self.default_config
         execution_id = f"exec-{uuid4().hex[:12]}"
         
+        # Let a prefetch of this image finish rather than pulling it again
+        pull = self._pulls.get(config.image)
+        if pull is not None:
+            await asyncio.shield(pull)
+        
         self._logger.info(
             "execution_starting",
             execution_id=execution_id,
@@ -159,53 +173,56 @@ class AgentRuntime:
             
             # Write input data
             input_file = exec_dir / "input.json"
-            input_file.write_text(json.dumps(input_data or {}))
+            input_file.write_bytes(orjson.dumps(input_data or {}, option=orjson.OPT_NON_STR_KEYS))
             
             # Build Docker command
             cmd = self._build_docker_command(config, exec_dir)
             
             # Execute with timeout
-            start_time = asyncio.get_event_loop().time()
+            start_ns = time.monotonic_ns()
+            
+            # Container output is written straight to these files
+            stdout_file = exec_dir / "stdout.txt"
+            stderr_file = exec_dir / "stderr.txt"
             
             try:
-                process = await asyncio.wait_for(
-                    self._run_container(cmd, config),
+                returncode = await asyncio.wait_for(
+                    self._run_container(cmd, config, stdout_file, stderr_file),
                     timeout=config.timeout_seconds,
                 )
                 
-                duration_ms = (asyncio.get_event_loop().time() - start_time) * 1000
+                duration_ms = (time.monotonic_ns() - start_ns) / 1_000_000
                 
                 # Read outputs
-                stdout_file = exec_dir / "stdout.txt"
-                stderr_file = exec_dir / "stderr.txt"
-                
-                stdout = stdout_file.read_text() if stdout_file.exists() else ""
-                stderr = stderr_file.read_text() if stderr_file.exists() else ""
+                stdout = stdout_file.read_text(errors="replace")
+                stderr = stderr_file.read_text(errors="replace")
                 
-                success = process.returncode == 0
+                success = returncode == 0
                 
                 # Compute execution hash for verification
-                execution_hash = hashlib.sha256(
-                    f"{code}{stdout}{stderr}{process.returncode}".encode()
-                ).hexdigest()
+                execution_hash = self._execution_hash(
+                    code, stdout_file, stderr_file, returncode
+                )
                 
                 result = ExecutionResult(
                     success=success,
-                    exit_code=process.returncode,
+                    exit_code=returncode,
                     stdout=stdout,
                     stderr=stderr,
                     duration_ms=duration_ms,
                     execution_hash=execution_hash,
                 )
                 
-                # Log execution
+                # Log execution; output is left out, the hash covers it
                 self._execution_logs[execution_id] = {
                     "agent_id": agent_id,
                     "execution_id": execution_id,
                     "config": config,
-                    "result": result,
-                    "timestamp": start_time,
+                    "result": replace(result, stdout="", stderr=""),
+                    "timestamp": start_ns / 1_000_000_000,  # monotonic seconds
                 }
+                if len(self._execution_logs) > self.max_execution_logs:
+                    self._execution_logs.popitem(last=False)
                 
                 self._logger.info(
                     "execution_completed",
@@ -227,9 +244,12 @@ class AgentRuntime:
                 )
                 
         finally:
-            # Cleanup
-            import shutil
-            shutil.rmtree(exec_dir, ignore_errors=True)
+            # Cleanup off the event loop; the result does not wait for it.
+            # Directories are not reused: the container can write anything
+            # into its mounted workspace, which must not reach the next run.
+            asyncio.get_running_loop().run_in_executor(
+                None, functools.partial(shutil.rmtree, exec_dir, ignore_errors=True)
+            )
     
     def _build_docker_command(self, config: ContainerConfig, exec_dir: Path) -> list[str]:
         """Build Docker run command."""
@@ -239,49 +259,74 @@ class AgentRuntime:
             "--network", config.network_mode if config.allow_internet else "none",
             "--cpus", str(config.cpu_limit),
             "--memory", config.memory_limit,
-            "--read-only" if config.read_only_root else "",
         ]
+        if config.read_only_root:
+            cmd.append("--read-only")
         
         # Add capability drops
         for cap in config.drop_capabilities:
-            cmd.extend(["--cap-drop", cap])
+            cmd += ("--cap-drop", cap)
         
         # Add volumes
-        cmd.extend(["-v", f"{exec_dir}:/workspace"])
+        cmd += ("-v", f"{exec_dir}:/workspace")
         for host, container in config.volumes:
-            cmd.extend(["-v", f"{host}:{container}"])
+            cmd += ("-v", f"{host}:{container}")
         
         # Add environment variables
         for key, value in config.env_vars.items():
-            cmd.extend(["-e", f"{key}={value}"])
+            cmd += ("-e", f"{key}={value}")
         
         # Add image and command
         cmd.append(config.image)
-        cmd.extend(config.command)
-        
-        # Remove empty strings
-        return [c for c in cmd if c]
+        cmd += config.command
+        return cmd
+    
+    @staticmethod
+    def _execution_hash(
+        code: str,
+        stdout_file: Path,
+        stderr_file: Path,
+        returncode: int,
+    ) -> str:
+        """Hash code, raw output and exit code incrementally, without concatenating them."""
+        digest = hashlib.sha256(code.encode())
+        for path in (stdout_file, stderr_file):
+            with path.open("rb") as f:
+                hashlib.file_digest(f, lambda: digest)
+        digest.update(str(returncode).encode())
+        return digest.hexdigest()
     
     async def _run_container(
         self,
         cmd: list[str],
         config: ContainerConfig,
-    ) -> subprocess.CompletedProcess:
-        """Run container and return result."""
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
+        stdout_file: Path,
+        stderr_file: Path,
+    ) -> int:
+        """
+        Run container, writing its output directly to the given files.
         
-        stdout, stderr = await process.communicate()
+        The child's stdout and stderr are redirected to the files rather
+        than piped through this process.
         
-        return subprocess.CompletedProcess(
-            args=cmd,
-            returncode=process.returncode,
-            stdout=stdout.decode(),
-            stderr=stderr.decode(),
-        )
+        Returns:
+            Container exit code
+        """
+        with stdout_file.open("wb") as stdout, stderr_file.open("wb") as stderr:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=stdout,
+                stderr=stderr,
+            )
+        
+        try:
+            await process.wait()
+        except asyncio.CancelledError:
+            # Timed out: don't leave the container running
+            process.kill()
+            raise
+        
+        return process.returncode
     
     async def stream_logs(
         self,
@@ -315,10 +360,39 @@ class AgentRuntime:
         return expected_hash is not None
     
     def get_execution_log(self, execution_id: str) -> dict[str, Any] | None:
-        """Get execution log."""
+        """
+        Get execution log.
+        
+        Only the most recent ``max_execution_logs`` executions are kept, and
+        logged results omit stdout/stderr.
+        """
         return self._execution_logs.get(execution_id)
     
+    def prefetch(self, image: str) -> asyncio.Task[bool]:
+        """
+        Start pulling an image in the background.
+        
+        Concurrent requests for the same image share one pull, so several
+        images can be fetched at once while the caller keeps setting up.
+        A failed pull is retried on the next request.
+        
+        Args:
+            image: Image to pull
+            
+        Returns:
+            Task resolving to True if the pull succeeded
+        """
+        pull = self._pulls.get(image)
+        if pull is None or (pull.done() and (pull.cancelled() or not pull.result())):
+            pull = asyncio.create_task(self._pull_image(image))
+            self._pulls[image] = pull
+        return pull
+    
     async def pull_image(self, image: str) -> bool:
+        """Pull container image, joining any prefetch already in progress."""
+        return await asyncio.shield(self.prefetch(image))
+    
+    async def _pull_image(self, image: str) -> bool:
         """Pull container image."""
         try:
             process = await asyncio.create_subprocess_exec(
@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
 import ast
 import builtins
+import importlib
+import multiprocessing
 import resource
 import signal
 import sys
+import time
 import traceback
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from types import ModuleType
+from multiprocessing.connection import Connection
+from types import CodeType, ModuleType
 from typing import Any, Callable
 
 import structlog
@@ -49,6 +55,9 @@ class SandboxConfig:
     allow_file_read: bool = False
     allow_file_write: bool = False
     allowed_paths: list[str] = field(default_factory=list)
+    
+    # Worker pool (used by Sandbox.aexecute)
+    pool_size: int = 4
 
 
 @dataclass
@@ -68,6 +77,68 @@ class SandboxResult:
     security_violations: list[str] = field(default_factory=list)
 
 
+# Validated, compiled snippets kept per Sandbox
+_COMPILE_CACHE_SIZE = 256
+
+_FILE_CALLS = frozenset({"open", "file"})
+_NETWORK_CALLS = frozenset({"socket", "connect", "urlopen"})
+
+
+class _SecurityVisitor:
+    """Single-pass AST check that counts nodes and records security violations."""
+    
+    def __init__(
+        self,
+        allowed_modules: frozenset[str],
+        blocked_builtins: frozenset[str],
+        block_files: bool,
+        block_network: bool,
+    ) -> None:
+        self.allowed_modules = allowed_modules
+        self.blocked_builtins = blocked_builtins
+        self.block_files = block_files
+        self.block_network = block_network
+        self.count = 0
+        self.violations: list[str] = []
+        self._checks: dict[type[ast.AST], Callable[[Any], None]] = {
+            ast.Import: self._check_import,
+            ast.ImportFrom: self._check_import_from,
+            ast.Call: self._check_call,
+        }
+    
+    def visit(self, tree: ast.AST) -> None:
+        """Count every node in the tree and run the checks for its type."""
+        # ast.walk is iterative, so deeply nested code cannot exhaust the stack
+        checks = self._checks
+        for node in ast.walk(tree):
+            self.count += 1
+            check = checks.get(type(node))
+            if check is not None:
+                check(node)
+    
+    def _check_import(self, node: ast.Import) -> None:
+        for alias in node.names:
+            if alias.name not in self.allowed_modules:
+                self.violations.append(f"import_not_allowed:{alias.name}")
+    
+    def _check_import_from(self, node: ast.ImportFrom) -> None:
+        if node.module not in self.allowed_modules:
+            self.violations.append(f"import_not_allowed:{node.module}")
+    
+    def _check_call(self, node: ast.Call) -> None:
+        func = node.func
+        if isinstance(func, ast.Name):
+            # Dangerous builtins and file operations
+            if func.id in self.blocked_builtins:
+                self.violations.append(f"blocked_builtin:{func.id}")
+            if self.block_files and func.id in _FILE_CALLS:
+                self.violations.append("file_operation_not_allowed")
+        elif isinstance(func, ast.Attribute):
+            # Network operations
+            if self.block_network and func.attr in _NETWORK_CALLS:
+                self.violations.append("network_operation_not_allowed")
+
+
 class Sandbox:
     """
     Secure sandbox for executing untrusted agent code.
@@ -87,13 +158,13 @@ class Sandbox:
             allowed_modules=["json", "math"],
         ))
         
-        result = sandbox.execute("""
+        result = sandbox.execute('''
             import json
             import math
             
             data = {"x": 10, "y": 20}
             result = math.sqrt(data["x"] ** 2 + data["y"] ** 2)
-        """)
+        ''')
         
         if result.success:
             print(f"Result: {result.result}")
@@ -105,6 +176,51 @@ class Sandbox:
     def __init__(self, config: SandboxConfig | None = None) -> None:
         self.config = config or SandboxConfig()
         self._logger = logger
+        self._pool: SandboxPool | None = None
+        
+        # Policy lookups and the restricted namespace are derived from the
+        # config once, not on every execution
+        self._allowed_modules = frozenset(self.config.allowed_modules)
+        self._blocked_builtins = frozenset(self.config.blocked_builtins)
+        self._safe_builtins = {
+            name: getattr(builtins, name)
+            for name in dir(builtins)
+            if name not in self._blocked_builtins
+            and not name.startswith("_")
+        }
+        self._modules: dict[str, ModuleType] = {}
+        for module_name in self.config.allowed_modules:
+            try:
+                self._modules[module_name] = importlib.import_module(module_name)
+            except ImportError:
+                pass
+        
+        # Code objects for snippets that passed validation, keyed by source
+        self._compile_cache: OrderedDict[str, CodeType] = OrderedDict()
+        self._memory_limited = False
+    
+    async def aexecute(self, code: str, context: dict[str, Any] | None = None) -> SandboxResult:
+        """
+        Execute code in a warm worker process without blocking the event loop.
+        
+        The worker pool is started on first use and reused across calls.
+        
+        Args:
+            code: Python code to execute
+            context: Variables to inject into execution context
+            
+        Returns:
+            Sandbox result
+        """
+        if self._pool is None:
+            self._pool = SandboxPool(self.config, size=self.config.pool_size)
+        return await self._pool.execute(code, context)
+    
+    async def close(self) -> None:
+        """Shut down the worker pool, if one was started."""
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
     
     def execute(self, code: str, context: dict[str, Any] | None = None) -> SandboxResult:
         """
@@ -117,49 +233,17 @@ class Sandbox:
         Returns:
             Sandbox result
         """
-        import time
-        
-        start_time = time.perf_counter()
-        violations: list[str] = []
-        
-        # Validate code size
-        if len(code) > self.config.max_code_size:
-            return SandboxResult(
-                success=False,
-                error=f"Code exceeds maximum size of {self.config.max_code_size}",
-                error_type="ValidationError",
-                security_violations=["code_too_large"],
-            )
+        start_ns = time.perf_counter_ns()
         
-        # Parse and validate AST
-        try:
-            tree = ast.parse(code)
-        except SyntaxError as e:
-            return SandboxResult(
-                success=False,
-                error=str(e),
-                error_type="SyntaxError",
-            )
-        
-        # Check AST complexity
-        node_count = sum(1 for _ in ast.walk(tree))
-        if node_count > self.config.max_ast_nodes:
-            return SandboxResult(
-                success=False,
-                error=f"Code too complex: {node_count} nodes > {self.config.max_ast_nodes}",
-                error_type="ValidationError",
-                security_violations=["too_complex"],
-            )
-        
-        # Analyze AST for security
-        violations = self._analyze_ast(tree)
-        if violations:
-            return SandboxResult(
-                success=False,
-                error=f"Security violations: {violations}",
-                error_type="SecurityError",
-                security_violations=violations,
-            )
+        # Code that already passed validation runs straight from the cache
+        compiled = self._compile_cache.get(code)
+        if compiled is None:
+            prepared = self._validate_and_compile(code)
+            if isinstance(prepared, SandboxResult):
+                return prepared
+            compiled = prepared
+        else:
+            self._compile_cache.move_to_end(code)
         
         # Set up restricted environment
         env = self._create_restricted_env()
@@ -171,8 +255,7 @@ class Sandbox:
         # Execute with resource limits
         try:
             # Set memory limit
-            memory_limit = self.config.max_memory_mb * 1024 * 1024
-            resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+            self._apply_memory_limit()
             
             # Set CPU time limit
             def timeout_handler(signum, frame):
@@ -182,12 +265,12 @@ class Sandbox:
             signal.alarm(int(self.config.max_execution_time))
             
             try:
-                exec(compile(tree, "<sandbox>", "exec"), env)
+                exec(compiled, env)
                 
                 # Get result (look for common result variables)
                 result_value = env.get("result") or env.get("_") or env.get("output")
                 
-                execution_time = (time.perf_counter() - start_time) * 1000
+                execution_time = (time.perf_counter_ns() - start_ns) / 1_000_000
                 
                 return SandboxResult(
                     success=True,
@@ -217,72 +300,103 @@ class Sandbox:
                 success=False,
                 error=str(e),
                 error_type=type(e).__name__,
-                execution_time_ms=(time.perf_counter() - start_time) * 1000,
+                execution_time_ms=(time.perf_counter_ns() - start_ns) / 1_000_000,
             )
     
-    def _analyze_ast(self, tree: ast.AST) -> list[str]:
-        """Analyze AST for security violations."""
-        violations = []
+    def _apply_memory_limit(self) -> None:
+        """Cap the process address space; the limit persists, so set it only once."""
+        if not self._memory_limited:
+            memory_limit = self.config.max_memory_mb * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+            self._memory_limited = True
+    
+    def _validate_and_compile(self, code: str) -> CodeType | SandboxResult:
+        """
+        Validate code and compile it, caching the code object on success.
         
-        for node in ast.walk(tree):
-            # Check imports
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    if alias.name not in self.config.allowed_modules:
-                        violations.append(f"import_not_allowed:{alias.name}")
-            
-            elif isinstance(node, ast.ImportFrom):
-                if node.module not in self.config.allowed_modules:
-                    violations.append(f"import_not_allowed:{node.module}")
-            
-            # Check for dangerous builtins
-            elif isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Name):
-                    if node.func.id in self.config.blocked_builtins:
-                        violations.append(f"blocked_builtin:{node.func.id}")
-            
-            # Check for file operations
-            elif isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Name):
-                    if node.func.id in ("open", "file"):
-                        if not self.config.allow_file_read and not self.config.allow_file_write:
-                            violations.append("file_operation_not_allowed")
-            
-            # Check for network operations
-            elif isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Attribute):
-                    if node.func.attr in ("socket", "connect", "urlopen"):
-                        if not self.config.allow_network:
-                            violations.append("network_operation_not_allowed")
+        Returns:
+            Compiled code, or a failed result describing why it was rejected
+        """
+        # Validate code size
+        if len(code) > self.config.max_code_size:
+            return SandboxResult(
+                success=False,
+                error=f"Code exceeds maximum size of {self.config.max_code_size}",
+                error_type="ValidationError",
+                security_violations=["code_too_large"],
+            )
+        
+        # Parse and validate AST
+        try:
+            tree = ast.parse(code)
+        except SyntaxError as e:
+            return SandboxResult(
+                success=False,
+                error=str(e),
+                error_type="SyntaxError",
+            )
+        
+        # Count nodes and collect violations in a single traversal
+        visitor = self._visit_ast(tree)
+        
+        # Check AST complexity
+        node_count = visitor.count
+        if node_count > self.config.max_ast_nodes:
+            return SandboxResult(
+                success=False,
+                error=f"Code too complex: {node_count} nodes > {self.config.max_ast_nodes}",
+                error_type="ValidationError",
+                security_violations=["too_complex"],
+            )
+        
+        # Analyze AST for security
+        violations = visitor.violations
+        if violations:
+            return SandboxResult(
+                success=False,
+                error=f"Security violations: {violations}",
+                error_type="SecurityError",
+                security_violations=violations,
+            )
+        
+        try:
+            compiled = compile(tree, "<sandbox>", "exec")
+        except SyntaxError as e:
+            return SandboxResult(
+                success=False,
+                error=str(e),
+                error_type="SyntaxError",
+            )
         
-        return violations
+        self._compile_cache[code] = compiled
+        if len(self._compile_cache) > _COMPILE_CACHE_SIZE:
+            self._compile_cache.popitem(last=False)
+        return compiled
+    
+    def _visit_ast(self, tree: ast.AST) -> _SecurityVisitor:
+        """Run the security visitor over a parsed tree."""
+        visitor = _SecurityVisitor(
+            allowed_modules=self._allowed_modules,
+            blocked_builtins=self._blocked_builtins,
+            block_files=not (self.config.allow_file_read or self.config.allow_file_write),
+            block_network=not self.config.allow_network,
+        )
+        visitor.visit(tree)
+        return visitor
+    
+    def _analyze_ast(self, tree: ast.AST) -> list[str]:
+        """Analyze AST for security violations."""
+        return self._visit_ast(tree).violations
     
     def _create_restricted_env(self) -> dict[str, Any]:
         """Create restricted execution environment."""
-        # Start with safe builtins
-        safe_builtins = {
-            name: getattr(builtins, name)
-            for name in dir(builtins)
-            if name not in self.config.blocked_builtins
-            and not name.startswith("_")
-        }
-        
-        # Create restricted environment
-        env = {
-            "__builtins__": safe_builtins,
+        # Builtins are copied so code cannot alter them for later runs in
+        # the same (pooled) worker
+        return {
+            "__builtins__": self._safe_builtins.copy(),
             "__name__": "__sandbox__",
+            **self._modules,
         }
-        
-        # Add allowed modules
-        for module_name in self.config.allowed_modules:
-            try:
-                import importlib
-                module = importlib.import_module(module_name)
-                env[module_name] = module
-            except ImportError:
-                pass
-        
-        return env
     
     def validate(self, code: str) -> tuple[bool, list[str]]:
         """
@@ -299,3 +413,184 @@ class Sandbox:
         violations = self._analyze_ast(tree)
         
         return len(violations) == 0, violations
+
+
+def _sandbox_worker_main(conn: Connection, config: SandboxConfig) -> None:
+    """Worker process loop: execute code received over the pipe."""
+    sandbox = Sandbox(config)
+    
+    # Limit the worker once at startup rather than on every execution
+    sandbox._apply_memory_limit()
+    
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            return
+        if request is None:
+            return
+        
+        code, context = request
+        result = sandbox.execute(code, context)
+        
+        try:
+            conn.send(result)
+        except Exception as e:
+            # Result value could not be pickled back to the parent
+            conn.send(SandboxResult(
+                success=False,
+                error=f"Result is not transferable: {e}",
+                error_type=type(e).__name__,
+                execution_time_ms=result.execution_time_ms,
+            ))
+
+
+@dataclass
+class _SandboxWorker:
+    """A pre-forked sandbox worker process and its pipe."""
+    
+    process: multiprocessing.process.BaseProcess
+    conn: Connection
+
+
+class SandboxPool:
+    """
+    Pool of warm worker processes for sandboxed execution.
+    
+    Workers are started once and receive code over a pipe, so each call
+    avoids interpreter startup and the parent event loop is never blocked
+    by resource limits or signal-based timeouts. A worker whose run fails
+    or stops responding is replaced with a fresh process, so no state
+    leaks into the next execution.
+    
+    Example:
+        ```python
+        pool = SandboxPool(SandboxConfig(allowed_modules=["math"]), size=2)
+        result = await pool.execute("result = math.sqrt(16)")
+        await pool.close()
+        ```
+    """
+
+    def __init__(self, config: SandboxConfig | None = None, size: int = 4) -> None:
+        self.config = config or SandboxConfig()
+        self.size = size
+        
+        self._idle: asyncio.Queue[_SandboxWorker] = asyncio.Queue()
+        self._workers: list[_SandboxWorker] = []
+        self._logger = logger
+        
+        # Forking a process that runs executor threads can copy held locks
+        # into the child, so workers start from a fresh interpreter
+        self._mp_context = multiprocessing.get_context("spawn")
+        
+        for _ in range(size):
+            self._idle.put_nowait(self._spawn())
+    
+    def _spawn(self) -> _SandboxWorker:
+        """Start a new worker process."""
+        parent_conn, child_conn = self._mp_context.Pipe()
+        process = self._mp_context.Process(
+            target=_sandbox_worker_main,
+            args=(child_conn, self.config),
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        
+        worker = _SandboxWorker(process=process, conn=parent_conn)
+        self._workers.append(worker)
+        return worker
+    
+    async def _retire(self, worker: _SandboxWorker) -> None:
+        """Terminate a worker and drop it from the pool."""
+        self._workers.remove(worker)
+        worker.process.kill()
+        # join() blocks, so it runs off the event loop
+        await asyncio.get_running_loop().run_in_executor(None, worker.process.join)
+        worker.conn.close()
+    
+    @staticmethod
+    def _stop(worker: _SandboxWorker) -> None:
+        """Ask a worker to exit, killing it if it does not (runs in a thread)."""
+        try:
+            worker.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        worker.process.join(timeout=1.0)
+        if worker.process.is_alive():
+            worker.process.kill()
+            worker.process.join()
+        worker.conn.close()
+    
+    def _roundtrip(
+        self,
+        worker: _SandboxWorker,
+        code: str,
+        context: dict[str, Any] | None,
+    ) -> SandboxResult | None:
+        """Send code to a worker and wait for its result (runs in a thread)."""
+        worker.conn.send((code, context))
+        # Allow the worker's own alarm to fire before treating it as hung
+        if not worker.conn.poll(self.config.max_execution_time + 1.0):
+            return None
+        try:
+            return worker.conn.recv()
+        except EOFError:
+            return None
+    
+    async def execute(self, code: str, context: dict[str, Any] | None = None) -> SandboxResult:
+        """
+        Execute code on an idle worker.
+        
+        Args:
+            code: Python code to execute
+            context: Variables to inject into execution context
+            
+        Returns:
+            Sandbox result
+        """
+        worker = await self._idle.get()
+        loop = asyncio.get_running_loop()
+        reusable = False
+        
+        try:
+            try:
+                result = await loop.run_in_executor(None, self._roundtrip, worker, code, context)
+            except Exception as e:
+                result = SandboxResult(
+                    success=False,
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+            
+            if result is None:
+                result = SandboxResult(
+                    success=False,
+                    error="Sandbox worker did not respond",
+                    error_type="TimeoutError",
+                    execution_time_ms=self.config.max_execution_time * 1000,
+                )
+            
+            reusable = result.success and worker.process.is_alive()
+            return result
+        finally:
+            if reusable:
+                self._idle.put_nowait(worker)
+            else:
+                # Replace the worker so a failed or abandoned run cannot affect
+                # the next one; the replacement is queued first so the pool
+                # keeps its size even if retiring is interrupted
+                self._logger.debug("sandbox_worker_recycled", pid=worker.process.pid)
+                self._idle.put_nowait(self._spawn())
+                await self._retire(worker)
+    
+    async def close(self) -> None:
+        """Stop all worker processes."""
+        workers, self._workers = self._workers, []
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(
+            loop.run_in_executor(None, self._stop, worker) for worker in workers
+        ))
+        
+        while not self._idle.empty():
+            self._idle.get_nowait()
@@ -2,18 +2,37 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import hashlib
+import hmac
 import json
+import os
+import secrets
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
+from types import CodeType
 from typing import Any
 
 import structlog
+from cryptography.exceptions import InvalidSignature, InvalidTag
+from cryptography.hazmat.primitives.asymmetric.ed25519 import (
+    Ed25519PrivateKey,
+    Ed25519PublicKey,
+)
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
 logger = structlog.get_logger()
 
+# Maximum age of a report, and of its anchor quote when the report was made
+_QUOTE_MAX_AGE = 300.0  # 5 minutes
 
-@dataclass
+# Compiled enclave code objects kept per runtime
+_COMPILE_CACHE_SIZE = 256
+
+
+@dataclass(slots=True)
 class TEEConfig:
     """Configuration for TEE execution."""
     
@@ -29,9 +48,17 @@ class TEEConfig:
     # Security
     allow_debug: bool = False
     seal_key_policy: str = "mrenclave"  # mrenclave, mrsigner
+    
+    # Attestation verification cache
+    attestation_cache_size: int = 4096
+    attestation_cache_ttl: float = 3600.0  # seconds, bounds revocation delay
+    
+    # Attested sessions: one quote vouches for an enclave signing key, which
+    # signs each result until the quote is renewed
+    attestation_anchor_ttl: float = 240.0  # seconds
 
 
-@dataclass
+@dataclass(slots=True)
 class AttestationReport:
     """TEE attestation report."""
     
@@ -43,9 +70,14 @@ class AttestationReport:
     # Verification
     is_valid: bool
     verification_data: dict[str, Any]
+    
+    # Session attestation: quote is the session anchor's, signature covers
+    # this report's claims
+    anchor_id: str | None = None
+    signature: bytes | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TEEResult:
     """Result of TEE execution."""
     
@@ -61,6 +93,24 @@ class TEEResult:
     code_hash: str | None = None
 
 
+def _signed_claims(
+    anchor_id: str,
+    code_hash: str,
+    result_hash: str,
+    timestamp: float,
+) -> bytes:
+    """Bytes an enclave session key signs for one attestation report."""
+    return f"{anchor_id}|{code_hash}|{result_hash}|{timestamp!r}".encode()
+
+
+def _result_hash(result: dict[str, Any]) -> str:
+    """SHA-256 of an execution result serialized as compact sorted-key JSON."""
+    # One serializer defines the canonical bytes, so any verifier can
+    # reproduce the digest with the standard library alone
+    data = json.dumps(result, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
 class TEERuntime:
     """
     Trusted Execution Environment runtime.
@@ -94,6 +144,19 @@ class TEERuntime:
         self.config = config or TEEConfig()
         self._initialized = False
         self._enclave_id: str | None = None
+        self._enclave_measurement: str | None = None
+        
+        # Session signing key and its anchor: (anchor_id, quote, issued_at)
+        self._session_key: Ed25519PrivateKey | None = None
+        self._anchor: tuple[str, bytes, float] | None = None
+        
+        # Compiled code by code hash, least recently used first
+        self._compile_cache: OrderedDict[str, CodeType] = OrderedDict()
+        
+        # (enclave_measurement, session public key, signer_measurement) -> (valid, expires_at)
+        self._verification_cache: OrderedDict[tuple[str, str, str], tuple[bool, float]] = (
+            OrderedDict()
+        )
         
         self._logger = logger
     
@@ -107,11 +170,11 @@ class TEERuntime:
         try:
             # Check TEE availability
             if self.config.tee_type == "sgx":
-                available = await self._check_sgx()
+                available = self._check_sgx()
             elif self.config.tee_type == "sev":
-                available = await self._check_sev()
+                available = self._check_sev()
             elif self.config.tee_type == "tdx":
-                available = await self._check_tdx()
+                available = self._check_tdx()
             else:
                 raise ValueError(f"Unsupported TEE type: {self.config.tee_type}")
             
@@ -120,7 +183,11 @@ class TEERuntime:
                 return False
             
             self._initialized = True
-            self._enclave_id = f"enclave-{hashlib.sha256(str(__import__('time').time()).encode()).hexdigest()[:16]}"
+            boot_digest = hashlib.sha256(str(time.time()).encode()).hexdigest()
+            self._enclave_id = f"enclave-{boot_digest[:16]}"
+            # Fixed for the enclave's lifetime; every attestation reports it
+            self._enclave_measurement = hashlib.sha256(self._enclave_id.encode()).hexdigest()
+            self._anchor = None
             
             self._logger.info(
                 "tee_initialized",
@@ -165,19 +232,17 @@ class TEERuntime:
             self._logger.info("tee_execution_starting", enclave_id=self._enclave_id)
             
             # Execute in simulated enclave
-            result = await self._execute_in_enclave(code, input_data or {})
+            result = await self._execute_in_enclave(code, code_hash, input_data or {})
+            
+            # Compute execution hash; the attestation quotes the same digest
+            execution_hash = _result_hash(result)
             
             # Generate attestation
             if self.config.attestation_required:
-                attestation = await self._generate_attestation(code_hash, result)
+                attestation = await self._generate_attestation(code_hash, execution_hash)
             else:
                 attestation = None
             
-            # Compute execution hash
-            execution_hash = hashlib.sha256(
-                json.dumps(result, sort_keys=True, default=str).encode()
-            ).hexdigest()
-            
             self._logger.info(
                 "tee_execution_completed",
                 enclave_id=self._enclave_id,
@@ -204,11 +269,10 @@ class TEERuntime:
     async def _execute_in_enclave(
         self,
         code: str,
+        code_hash: str,
         input_data: dict[str, Any],
     ) -> dict[str, Any]:
-        """Execute code in simulated enclave."""
-        import time
-        
+        """Execute code in simulated enclave, reusing its compiled form on repeat runs."""
         # In production, this would:
         # 1. Load code into enclave
         # 2. Seal input data
@@ -223,7 +287,16 @@ class TEERuntime:
             namespace = {"__builtins__": __builtins__}
             namespace["input_data"] = input_data
             
-            exec(code, namespace)
+            compiled = self._compile_cache.get(code_hash)
+            if compiled is None:
+                compiled = compile(code, "<string>", "exec")
+                self._compile_cache[code_hash] = compiled
+                if len(self._compile_cache) > _COMPILE_CACHE_SIZE:
+                    self._compile_cache.popitem(last=False)
+            else:
+                self._compile_cache.move_to_end(code_hash)
+            
+            exec(compiled, namespace)
             
             output = namespace.get("output") or namespace.get("result")
             
@@ -243,39 +316,58 @@ class TEERuntime:
     async def _generate_attestation(
         self,
         code_hash: str,
-        result: dict[str, Any],
+        result_hash: str,
     ) -> AttestationReport:
-        """Generate TEE attestation report."""
-        import time
-        
-        # In production, this would generate a real TEE quote
-        # using the platform's attestation service
-        
-        # Simulated attestation
-        quote_data = {
-            "enclave_id": self._enclave_id,
-            "code_hash": code_hash,
-            "result_hash": hashlib.sha256(
-                json.dumps(result, sort_keys=True, default=str).encode()
-            ).hexdigest(),
-            "timestamp": time.time(),
-            "tee_type": self.config.tee_type,
-        }
+        """
+        Generate TEE attestation report.
         
-        quote = base64.b64encode(json.dumps(quote_data).encode()).decode()
+        The report reuses the session's anchor quote and carries only a
+        session key signature over its own claims, so a burst of executions
+        costs one quote rather than one each.
+        """
+        now = time.time()
+        anchor_id, quote = self._current_anchor(now)
         
         return AttestationReport(
-            quote=quote.encode(),
-            timestamp=time.time(),
-            enclave_measurement=hashlib.sha256(self._enclave_id.encode()).hexdigest(),
+            quote=quote,
+            timestamp=now,
+            enclave_measurement=self._enclave_measurement,
             signer_measurement="simulated_signer_hash",
             is_valid=True,
             verification_data={
                 "quote_version": "1.0",
                 "tee_type": self.config.tee_type,
+                "code_hash": code_hash,
+                "result_hash": result_hash,
             },
+            anchor_id=anchor_id,
+            signature=self._session_key.sign(
+                _signed_claims(anchor_id, code_hash, result_hash, now)
+            ),
         )
     
+    def _current_anchor(self, now: float) -> tuple[str, bytes]:
+        """Return the session anchor, renewing the key and its quote when due."""
+        if self._anchor is None or now - self._anchor[2] > self.config.attestation_anchor_ttl:
+            self._session_key = Ed25519PrivateKey.generate()
+            anchor_id = secrets.token_hex(8)
+            
+            # In production, this would generate a real TEE quote binding the
+            # public key, using the platform's attestation service
+            
+            # Simulated attestation
+            quote_data = {
+                "enclave_id": self._enclave_id,
+                "anchor_id": anchor_id,
+                "public_key": self._session_key.public_key().public_bytes_raw().hex(),
+                "timestamp": now,
+                "tee_type": self.config.tee_type,
+            }
+            
+            self._anchor = (anchor_id, base64.b64encode(json.dumps(quote_data).encode()), now)
+        
+        return self._anchor[0], self._anchor[1]
+    
     async def verify_attestation(self, attestation: AttestationReport) -> bool:
         """
         Verify an attestation report.
@@ -286,6 +378,28 @@ class TEERuntime:
         Returns:
             True if valid
         """
+        return await self._verify_attestation(attestation, offload=False)
+    
+    async def verify_attestations(self, attestations: list[AttestationReport]) -> list[bool]:
+        """
+        Verify several attestation reports concurrently.
+        
+        Quotes missing from the verification cache are checked on worker
+        threads, so signature checks that release the GIL run in parallel
+        rather than one after another on the event loop.
+        
+        Args:
+            attestations: Attestations to verify
+            
+        Returns:
+            Validity of each attestation, in order
+        """
+        return list(await asyncio.gather(
+            *(self._verify_attestation(a, offload=True) for a in attestations)
+        ))
+    
+    async def _verify_attestation(self, attestation: AttestationReport, offload: bool) -> bool:
+        """Verify an attestation, checking a cache miss on a worker thread if offload."""
         try:
             # In production, this would:
             # 1. Verify quote signature
@@ -294,22 +408,90 @@ class TEERuntime:
             # 4. Check revocation lists
             
             # Simulation: just check basic structure
-            if not attestation.quote:
+            if not attestation.quote or not attestation.signature:
                 return False
             
             data = json.loads(base64.b64decode(attestation.quote))
             
-            # Verify timestamp not too old
-            import time
-            if time.time() - data.get("timestamp", 0) > 300:  # 5 minutes
+            # Verify the report, and the anchor it was made under, are not too old
+            now = time.time()
+            if (
+                now - attestation.timestamp > _QUOTE_MAX_AGE
+                or attestation.timestamp - data.get("timestamp", 0) > _QUOTE_MAX_AGE
+            ):
                 return False
             
-            return True
+            # The anchor quote only vouches for the session key, so every
+            # report signed under the same anchor reuses the cached outcome
+            key = (
+                attestation.enclave_measurement,
+                data.get("public_key", ""),
+                attestation.signer_measurement,
+            )
+            cached = self._verification_cache.get(key)
+            if cached is not None and cached[1] > now:
+                self._verification_cache.move_to_end(key)
+                valid = cached[0]
+            else:
+                if offload:
+                    valid = await asyncio.to_thread(self._verify_quote, attestation, data)
+                else:
+                    valid = self._verify_quote(attestation, data)
+                
+                self._verification_cache[key] = (valid, now + self.config.attestation_cache_ttl)
+                self._verification_cache.move_to_end(key)
+                if len(self._verification_cache) > self.config.attestation_cache_size:
+                    self._verification_cache.popitem(last=False)
+            
+            if not valid:
+                return False
+            
+            if offload:
+                return await asyncio.to_thread(self._verify_signature, attestation, data)
+            return self._verify_signature(attestation, data)
             
         except Exception as e:
             self._logger.error("attestation_verification_failed", error=str(e))
             return False
     
+    def _verify_quote(self, attestation: AttestationReport, data: dict[str, Any]) -> bool:
+        """
+        Verify a quote against its claimed measurements.
+        
+        In production this checks the quote signature chain and known good
+        MRENCLAVE values. Simulation: the quoted enclave must hash to the
+        reported measurement.
+        """
+        enclave_id = data.get("enclave_id")
+        if not enclave_id:
+            return False
+        # Constant-time, as a real MAC or signature check must be
+        return hmac.compare_digest(
+            hashlib.sha256(enclave_id.encode()).hexdigest(),
+            attestation.enclave_measurement,
+        )
+    
+    def _verify_signature(self, attestation: AttestationReport, data: dict[str, Any]) -> bool:
+        """Verify the report's claims were signed by its anchor's session key."""
+        if attestation.anchor_id != data.get("anchor_id"):
+            return False
+        
+        public_key = Ed25519PublicKey.from_public_bytes(bytes.fromhex(data["public_key"]))
+        claims = attestation.verification_data
+        try:
+            public_key.verify(
+                attestation.signature,
+                _signed_claims(
+                    attestation.anchor_id,
+                    claims.get("code_hash", ""),
+                    claims.get("result_hash", ""),
+                    attestation.timestamp,
+                ),
+            )
+        except InvalidSignature:
+            return False
+        return True
+    
     async def seal_data(self, data: bytes) -> bytes:
         """
         Seal data for enclave-only access.
@@ -321,14 +503,11 @@ class TEERuntime:
             Sealed data
         """
         # In production, this would use TEE sealing key
-        # Simulation: simple encryption
-        import secrets
-        
-        key = secrets.token_bytes(32)
-        # XOR with key (not secure, just for simulation)
-        sealed = bytes(a ^ b for a, b in zip(data, key * (len(data) // 32 + 1)))
-        
-        return key + sealed
+        # Simulation: a fresh key travels with the data, but the payload is
+        # AES-256-GCM encrypted and authenticated (AES-NI accelerated)
+        key = AESGCM.generate_key(bit_length=256)
+        nonce = secrets.token_bytes(12)
+        return key + nonce + AESGCM(key).encrypt(nonce, data, None)
     
     async def unseal_data(self, sealed_data: bytes) -> bytes | None:
         """
@@ -340,32 +519,34 @@ class TEERuntime:
         Returns:
             Original data or None if invalid
         """
-        if len(sealed_data) < 32:
+        # Key, nonce and at least the 16-byte authentication tag
+        if len(sealed_data) < 32 + 12 + 16:
             return None
         
         key = sealed_data[:32]
-        encrypted = sealed_data[32:]
+        nonce = sealed_data[32:44]
         
-        # XOR to decrypt
-        return bytes(a ^ b for a, b in zip(encrypted, key * (len(encrypted) // 32 + 1)))
+        try:
+            return AESGCM(key).decrypt(nonce, sealed_data[44:], None)
+        except InvalidTag:
+            return None
     
-    async def _check_sgx(self) -> bool:
+    def _check_sgx(self) -> bool:
         """Check if Intel SGX is available."""
         # Check for SGX device
-        import os
         return os.path.exists("/dev/sgx_enclave") or os.path.exists("/dev/isgx")
     
-    async def _check_sev(self) -> bool:
+    def _check_sev(self) -> bool:
         """Check if AMD SEV is available."""
-        import os
         return os.path.exists("/dev/sev")
     
-    async def _check_tdx(self) -> bool:
+    def _check_tdx(self) -> bool:
         """Check if Intel TDX is available."""
-        import os
         return os.path.exists("/dev/tdx_guest")
     
     async def shutdown(self) -> None:
         """Shutdown TEE runtime."""
         self._initialized = False
+        self._session_key = None
+        self._anchor = None
         self._logger.info("tee_shutdown", enclave_id=self._enclave_id)
@@ -4,10 +4,13 @@ from __future__ import annotations
 
 import heapq
 import time
+from collections import deque
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from decimal import Decimal
+from itertools import islice
+from secrets import token_hex
 from typing import Any
-from uuid import uuid4
 
 import structlog
 
@@ -15,12 +18,26 @@ from agent_infrastructure_platform.common.types import AgentID, Task
 
 logger = structlog.get_logger()
 
+# Bit index assigned to each capability name on first use
+_CAPABILITY_BITS: dict[str, int] = {}
 
-@dataclass
+
+def _capability_mask(capabilities: list[str]) -> int:
+    """Encode capability names as a bitmask."""
+    mask = 0
+    for cap in capabilities:
+        bit = _CAPABILITY_BITS.get(cap)
+        if bit is None:
+            bit = _CAPABILITY_BITS[cap] = len(_CAPABILITY_BITS)
+        mask |= 1 << bit
+    return mask
+
+
+@dataclass(slots=True)
 class Bid:
     """Bid for a resource or task."""
     
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=lambda: token_hex(16))
     agent_id: AgentID = ""
     
     # What is being bid on
@@ -42,13 +59,22 @@ class Bid:
     
     # Status
     status: str = "active"  # active, matched, cancelled, expired
+    
+    # Matching keys fixed at construction: the exact price as a Decimal,
+    # and required_capabilities as a bitmask
+    price_key: Decimal = field(default=Decimal(0), init=False, repr=False, compare=False)
+    required_mask: int = field(default=0, init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        self.price_key = Decimal(self.price)
+        self.required_mask = _capability_mask(self.required_capabilities)
 
 
-@dataclass
+@dataclass(slots=True)
 class Ask:
     """Ask (offer) for a resource or task."""
     
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=lambda: token_hex(16))
     agent_id: AgentID = ""
     
     # What is being offered
@@ -70,13 +96,22 @@ class Ask:
     
     # Status
     status: str = "active"
+    
+    # Matching keys fixed at construction: the exact price as a Decimal,
+    # and capabilities as a bitmask
+    price_key: Decimal = field(default=Decimal(0), init=False, repr=False, compare=False)
+    capability_mask: int = field(default=0, init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        self.price_key = Decimal(self.price)
+        self.capability_mask = _capability_mask(self.capabilities)
 
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
     """Completed trade."""
     
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=lambda: token_hex(16))
     bid_id: str = ""
     ask_id: str = ""
     
@@ -132,20 +167,31 @@ class ResourceMarket:
         self,
         matching_interval: float = 5.0,
         min_price_increment: Decimal = Decimal("0.001"),
+        max_trade_history: int = 100_000,
     ) -> None:
         self.matching_interval = matching_interval
         self.min_price_increment = min_price_increment
+        self.max_trade_history = max_trade_history
         
         # Order books
         self._bids: dict[str, Bid] = {}
         self._asks: dict[str, Ask] = {}
         
-        # Indexed by resource type
-        self._bids_by_resource: dict[str, list[str]] = {}
-        self._asks_by_resource: dict[str, list[str]] = {}
+        # Price-time priority heaps per resource type: bids keyed by
+        # (-price_key, timestamp, id), asks by (price_key, timestamp, id),
+        # each entry carrying the order itself (the unique id means it is
+        # never compared). Asks are further split by capability_mask, so a
+        # bid only looks at asks offering every capability it requires.
+        self._bids_by_resource: dict[str, list[tuple[Decimal, float, str, Bid]]] = {}
+        self._asks_by_resource: dict[str, dict[int, list[tuple[Decimal, float, str, Ask]]]] = {}
         
-        # Trade history
-        self._trades: list[Trade] = []
+        # (expires_at, order id, order) heaps, swept before each matching round
+        self._bid_expiries: list[tuple[float, str, Bid]] = []
+        self._ask_expiries: list[tuple[float, str, Ask]] = []
+        
+        # Most recent trades, overall and per resource type
+        self._trades: deque[Trade] = deque(maxlen=max_trade_history)
+        self._trades_by_resource: dict[str, deque[Trade]] = {}
         
         # Price history
         self._price_history: dict[str, list[tuple[float, Decimal]]] = {}
@@ -194,7 +240,11 @@ class ResourceMarket:
         
         if resource_type not in self._bids_by_resource:
             self._bids_by_resource[resource_type] = []
-        self._bids_by_resource[resource_type].append(bid.id)
+        heapq.heappush(
+            self._bids_by_resource[resource_type],
+            (-bid.price_key, bid.timestamp, bid.id, bid),
+        )
+        heapq.heappush(self._bid_expiries, (bid.expires_at, bid.id, bid))
         
         self._logger.info(
             "bid_placed",
@@ -248,8 +298,15 @@ class ResourceMarket:
         self._asks[ask.id] = ask
         
         if resource_type not in self._asks_by_resource:
-            self._asks_by_resource[resource_type] = []
-        self._asks_by_resource[resource_type].append(ask.id)
+            self._asks_by_resource[resource_type] = {}
+        books = self._asks_by_resource[resource_type]
+        if ask.capability_mask not in books:
+            books[ask.capability_mask] = []
+        heapq.heappush(
+            books[ask.capability_mask],
+            (ask.price_key, ask.timestamp, ask.id, ask),
+        )
+        heapq.heappush(self._ask_expiries, (ask.expires_at, ask.id, ask))
         
         self._logger.info(
             "ask_placed",
@@ -287,50 +344,67 @@ class ResourceMarket:
         """
         trades = []
         
+        now = time.time()
+        self._expire_orders(self._bid_expiries, now)
+        self._expire_orders(self._ask_expiries, now)
+        
         for resource_type in set(self._bids_by_resource.keys()) | set(self._asks_by_resource.keys()):
-            resource_trades = await self._match_resource(resource_type)
+            resource_trades = await self._match_resource(resource_type, now)
             trades.extend(resource_trades)
         
         return trades
     
-    async def _match_resource(self, resource_type: str) -> list[Trade]:
-        """Match orders for a specific resource."""
+    async def _match_resource(self, resource_type: str, now: float) -> list[Trade]:
+        """
+        Match orders for a specific resource.
+        
+        The best bid is swept against asks in price-time priority until it
+        is filled or no ask crosses it, drawing only on the books of asks
+        with every capability it requires. Asks failing the bid's reputation
+        requirement are set aside for that bid only. Orders no longer active
+        are dropped as they reach the top of their book.
+        """
         trades = []
         
-        # Get active bids and asks
-        bids = [
-            self._bids[bid_id] for bid_id in self._bids_by_resource.get(resource_type, [])
-            if self._bids[bid_id].status == "active" and not self._is_expired(self._bids[bid_id])
-        ]
+        bid_heap = self._bids_by_resource.get(resource_type)
+        ask_books = self._asks_by_resource.get(resource_type)
+        if not bid_heap or not ask_books:
+            return trades
         
-        asks = [
-            self._asks[ask_id] for ask_id in self._asks_by_resource.get(resource_type, [])
-            if self._asks[ask_id].status == "active" and not self._is_expired(self._asks[ask_id])
-        ]
+        if resource_type not in self._trades_by_resource:
+            self._trades_by_resource[resource_type] = deque(maxlen=self.max_trade_history)
+        resource_history = self._trades_by_resource[resource_type]
         
-        if not bids or not asks:
-            return trades
+        # Bids no ask could fill this round
+        unfilled = []
         
-        # Sort bids by price (descending) and asks by price (ascending)
-        bids.sort(key=lambda b: b.price, reverse=True)
-        asks.sort(key=lambda a: a.price)
+        # Sum of trade prices, for the round's average
+        price_total = Decimal(0)
         
-        # Match orders
-        for bid in bids:
-            for ask in list(asks):  # Copy to modify during iteration
-                if bid.status != "active" or ask.status != "active":
-                    continue
+        while bid_heap:
+            bid = bid_heap[0][3]
+            if bid.status != "active":
+                heapq.heappop(bid_heap)
+                continue
+            
+            eligible = [
+                heap for mask, heap in ask_books.items() if not bid.required_mask & ~mask
+            ]
+            
+            skipped = []
+            while bid.quantity > 0:
+                ask_heap = self._best_ask(eligible)
+                if ask_heap is None:
+                    break
+                ask = ask_heap[0][3]
                 
-                # Check if prices match
-                if bid.price < ask.price:
-                    continue
+                # Check if prices match; no later ask is cheaper
+                if bid.price_key < ask.price_key:
+                    break
                 
                 # Check reputation requirement
                 if ask.reputation_score < bid.min_reputation:
-                    continue
-                
-                # Check capability requirements
-                if not all(cap in ask.capabilities for cap in bid.required_capabilities):
+                    skipped.append((ask_heap, heapq.heappop(ask_heap)))
                     continue
                 
                 # Calculate trade quantity
@@ -354,17 +428,16 @@ class ResourceMarket:
                 
                 trades.append(trade)
                 self._trades.append(trade)
+                price_total += trade_price
+                resource_history.append(trade)
                 
                 # Update orders
                 bid.quantity -= trade_quantity
                 ask.quantity -= trade_quantity
                 
-                if bid.quantity == 0:
-                    bid.status = "matched"
-                
                 if ask.quantity == 0:
                     ask.status = "matched"
-                    asks.remove(ask)
+                    heapq.heappop(ask_heap)
                 
                 self._logger.info(
                     "trade_executed",
@@ -375,21 +448,57 @@ class ResourceMarket:
                     quantity=trade_quantity,
                     price=trade_price,
                 )
+            
+            for ask_heap, entry in skipped:
+                heapq.heappush(ask_heap, entry)
+            
+            if bid.quantity == 0:
+                bid.status = "matched"
+                heapq.heappop(bid_heap)
+                continue
+            
+            unfilled.append(heapq.heappop(bid_heap))
+            if not skipped:
+                ask_heap = self._best_ask(ask_books.values())
+                if ask_heap is None or ask_heap[0][0] > bid.price_key:
+                    # No ask crosses this bid, so none crosses a lower one
+                    break
+        
+        for entry in unfilled:
+            heapq.heappush(bid_heap, entry)
         
         # Update price history
         if trades:
-            avg_price = sum(t.price for t in trades) / len(trades)
+            avg_price = price_total / len(trades)
             if resource_type not in self._price_history:
                 self._price_history[resource_type] = []
-            self._price_history[resource_type].append((time.time(), avg_price))
+            self._price_history[resource_type].append((now, avg_price))
         
         return trades
     
-    def _is_expired(self, order: Bid | Ask) -> bool:
-        """Check if an order is expired."""
-        if order.expires_at is None:
-            return False
-        return time.time() > order.expires_at
+    @staticmethod
+    def _best_ask(
+        books: Iterable[list[tuple[Decimal, float, str, Ask]]],
+    ) -> list[tuple[Decimal, float, str, Ask]] | None:
+        """Return the ask book whose top is the best active ask, if any."""
+        best = None
+        for heap in books:
+            while heap and heap[0][3].status != "active":
+                heapq.heappop(heap)
+            if heap and (best is None or heap[0] < best[0]):
+                best = heap
+        return best
+    
+    @staticmethod
+    def _expire_orders(
+        expiries: list[tuple[float, str, Bid]] | list[tuple[float, str, Ask]],
+        now: float,
+    ) -> None:
+        """Mark orders whose expiry has passed as expired."""
+        while expiries and expiries[0][0] < now:
+            order = heapq.heappop(expiries)[2]
+            if order.status == "active":
+                order.status = "expired"
     
     async def get_price(self, resource_type: str) -> Decimal | None:
         """Get current market price for a resource."""
@@ -403,13 +512,19 @@ class ResourceMarket:
         resource_type: str,
     ) -> tuple[list[Bid], list[Ask]]:
         """Get current order book for a resource."""
+        # Best orders first
         bids = [
-            self._bids[bid_id] for bid_id in self._bids_by_resource.get(resource_type, [])
-            if self._bids[bid_id].status == "active"
+            bid for _, _, _, bid in sorted(self._bids_by_resource.get(resource_type, []))
+            if bid.status == "active"
         ]
         asks = [
-            self._asks[ask_id] for ask_id in self._asks_by_resource.get(resource_type, [])
-            if self._asks[ask_id].status == "active"
+            ask
+            for _, _, _, ask in sorted(
+                entry
+                for heap in self._asks_by_resource.get(resource_type, {}).values()
+                for entry in heap
+            )
+            if ask.status == "active"
         ]
         
         return bids, asks
@@ -419,10 +534,17 @@ class ResourceMarket:
         resource_type: str | None = None,
         limit: int = 100,
     ) -> list[Trade]:
-        """Get trade history."""
-        trades = self._trades
+        """
+        Get trade history, oldest first.
         
+        Only the most recent ``max_trade_history`` trades are kept, overall
+        and per resource type.
+        """
         if resource_type:
-            trades = [t for t in trades if t.resource_type == resource_type]
+            trades = self._trades_by_resource.get(resource_type, ())
+        else:
+            trades = self._trades
         
-        return trades[-limit:]
+        recent = list(islice(reversed(trades), limit))
+        recent.reverse()
+        return recent
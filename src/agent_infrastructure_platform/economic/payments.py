@@ -4,10 +4,11 @@ from __future__ import annotations
 
 import hashlib
 import time
+from collections import defaultdict
 from dataclasses import dataclass, field
 from decimal import Decimal
+from secrets import token_hex
 from typing import Any
-from uuid import uuid4
 
 import structlog
 
@@ -16,11 +17,11 @@ from agent_infrastructure_platform.common.types import AgentID
 logger = structlog.get_logger()
 
 
-@dataclass
+@dataclass(slots=True)
 class Payment:
     """A single payment."""
     
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=lambda: token_hex(16))
     sender: AgentID = ""
     recipient: AgentID = ""
     amount: Decimal = Decimal("0")
@@ -43,11 +44,11 @@ class Payment:
         return hashlib.sha256(data.encode()).hexdigest()
 
 
-@dataclass
+@dataclass(slots=True)
 class PaymentChannel:
     """State channel for off-chain micropayments."""
     
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=lambda: token_hex(16))
     agent_a: AgentID = ""
     agent_b: AgentID = ""
     
@@ -163,16 +164,17 @@ class PaymentProcessor:
         
         # Active channels
         self._channels: dict[str, PaymentChannel] = {}
-        self._agent_channels: dict[AgentID, list[str]] = {}
+        self._agent_channels: dict[AgentID, list[PaymentChannel]] = {}
         
         # Pending settlements
         self._pending_settlements: list[PaymentChannel] = []
         
-        # Transaction history
+        # Transaction history, overall and per sending or receiving agent
         self._transactions: list[Payment] = []
+        self._agent_transactions: dict[AgentID, list[Payment]] = {}
         
         # Agent balances (on-chain)
-        self._balances: dict[AgentID, Decimal] = {}
+        self._balances: defaultdict[AgentID, Decimal] = defaultdict(Decimal)
         
         self._logger = logger
     
@@ -209,19 +211,19 @@ class PaymentProcessor:
         )
         
         # Update balances
-        self._balances[agent_a] = self._balances.get(agent_a, Decimal("0")) - deposit_a
-        self._balances[agent_b] = self._balances.get(agent_b, Decimal("0")) - deposit_b
+        self._balances[agent_a] -= deposit_a
+        self._balances[agent_b] -= deposit_b
         
         # Store channel
         self._channels[channel.id] = channel
         
         if agent_a not in self._agent_channels:
             self._agent_channels[agent_a] = []
-        self._agent_channels[agent_a].append(channel.id)
+        self._agent_channels[agent_a].append(channel)
         
         if agent_b not in self._agent_channels:
             self._agent_channels[agent_b] = []
-        self._agent_channels[agent_b].append(channel.id)
+        self._agent_channels[agent_b].append(channel)
         
         self._logger.info(
             "channel_opened",
@@ -262,8 +264,8 @@ class PaymentProcessor:
         final_balances = channel.close()
         
         # Settle on-chain
-        self._balances[channel.agent_a] = self._balances.get(channel.agent_a, Decimal("0")) + channel.balance_a
-        self._balances[channel.agent_b] = self._balances.get(channel.agent_b, Decimal("0")) + channel.balance_b
+        self._balances[channel.agent_a] += channel.balance_a
+        self._balances[channel.agent_b] += channel.balance_b
         
         self._logger.info(
             "channel_closed",
@@ -311,10 +313,14 @@ class PaymentProcessor:
         
         # Update balances
         self._balances[sender] -= amount
-        self._balances[recipient] = self._balances.get(recipient, Decimal("0")) + amount
+        self._balances[recipient] += amount
         
         # Record
         self._transactions.append(payment)
+        for agent_id in {sender, recipient}:
+            if agent_id not in self._agent_transactions:
+                self._agent_transactions[agent_id] = []
+            self._agent_transactions[agent_id].append(payment)
         
         self._logger.info(
             "payment_completed",
@@ -332,7 +338,7 @@ class PaymentProcessor:
     
     async def deposit(self, agent_id: AgentID, amount: Decimal) -> bool:
         """Deposit funds to agent's account."""
-        self._balances[agent_id] = self._balances.get(agent_id, Decimal("0")) + amount
+        self._balances[agent_id] += amount
         
         self._logger.info("deposit", agent_id=agent_id, amount=amount)
         return True
@@ -353,8 +359,7 @@ class PaymentProcessor:
     
     def get_agent_channels(self, agent_id: AgentID) -> list[PaymentChannel]:
         """Get all channels for an agent."""
-        channel_ids = self._agent_channels.get(agent_id, [])
-        return [self._channels[cid] for cid in channel_ids if cid in self._channels]
+        return list(self._agent_channels.get(agent_id, ()))
     
     async def get_transaction_history(
         self,
@@ -362,12 +367,9 @@ class PaymentProcessor:
         limit: int = 100,
     ) -> list[Payment]:
         """Get transaction history."""
-        transactions = self._transactions
-        
         if agent_id:
-            transactions = [
-                t for t in transactions
-                if t.sender == agent_id or t.recipient == agent_id
-            ]
+            transactions = self._agent_transactions.get(agent_id, [])
+        else:
+            transactions = self._transactions
         
         return transactions[-limit:]
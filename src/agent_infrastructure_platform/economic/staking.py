@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import time
+from collections import defaultdict
 from dataclasses import dataclass, field
 from decimal import Decimal
+from secrets import token_hex
 from typing import Any
-from uuid import uuid4
 
 import structlog
 
@@ -15,11 +16,11 @@ from agent_infrastructure_platform.common.types import AgentID
 logger = structlog.get_logger()
 
 
-@dataclass
+@dataclass(slots=True)
 class Stake:
     """A stake placed by an agent."""
     
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=lambda: token_hex(16))
     agent_id: AgentID = ""
     
     # Stake details
@@ -42,11 +43,11 @@ class Stake:
     slash_reason: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class SlashingEvent:
     """Record of a slashing event."""
     
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=lambda: token_hex(16))
     stake_id: str = ""
     agent_id: AgentID = ""
     
@@ -109,19 +110,35 @@ class StakingPool:
         
         # Stakes
         self._stakes: dict[str, Stake] = {}
-        self._agent_stakes: dict[AgentID, list[str]] = {}
+        self._agent_stakes: dict[AgentID, list[Stake]] = {}
         
-        # Slashing history
+        # Slashing history, overall and per agent
         self._slashing_events: list[SlashingEvent] = []
+        self._agent_slashing_events: dict[AgentID, list[SlashingEvent]] = {}
         
-        # Total staked
-        self._total_staked: dict[str, Decimal] = {}
+        # Total staked, per stake type and overall
+        self._total_staked: defaultdict[str, Decimal] = defaultdict(Decimal)
+        self._total_staked_all: Decimal = Decimal("0")
+        
+        # Unslashed amount of each agent's active stakes
+        self._agent_collateral: defaultdict[AgentID, Decimal] = defaultdict(Decimal)
         
         # Rewards
         self._reward_pool: Decimal = Decimal("0")
         
         self._logger = logger
     
+    @property
+    def slash_threshold(self) -> float:
+        """Fraction of a stake that, once slashed, marks it slashed."""
+        return self._slash_threshold
+    
+    @slash_threshold.setter
+    def slash_threshold(self, value: float) -> None:
+        self._slash_threshold = value
+        # Converted once here rather than on every slash
+        self._slash_fraction = Decimal(str(value))
+    
     async def stake(
         self,
         agent_id: AgentID,
@@ -160,12 +177,12 @@ class StakingPool:
         
         if agent_id not in self._agent_stakes:
             self._agent_stakes[agent_id] = []
-        self._agent_stakes[agent_id].append(stake.id)
+        self._agent_stakes[agent_id].append(stake)
         
         # Update totals
-        if stake_type not in self._total_staked:
-            self._total_staked[stake_type] = Decimal("0")
         self._total_staked[stake_type] += amount
+        self._total_staked_all += amount
+        self._agent_collateral[agent_id] += amount
         
         self._logger.info(
             "stake_created",
@@ -213,7 +230,7 @@ class StakingPool:
         stake.slash_amount += actual_slash
         stake.slash_reason = reason
         
-        if stake.slash_amount >= stake.amount * Decimal(str(self.slash_threshold)):
+        if stake.slash_amount >= stake.amount * self._slash_fraction:
             stake.status = "slashed"
         
         # Record event
@@ -226,10 +243,18 @@ class StakingPool:
             processed_by=processed_by,
         )
         self._slashing_events.append(event)
+        if stake.agent_id not in self._agent_slashing_events:
+            self._agent_slashing_events[stake.agent_id] = []
+        self._agent_slashing_events[stake.agent_id].append(event)
         
-        # Update totals
+        # Update totals; a slashed stake no longer backs reputation
         stake_type = stake.stake_type
         self._total_staked[stake_type] -= actual_slash
+        self._total_staked_all -= actual_slash
+        if stake.status == "slashed":
+            self._agent_collateral[stake.agent_id] -= available
+        else:
+            self._agent_collateral[stake.agent_id] -= actual_slash
         
         # Add to reward pool
         self._reward_pool += actual_slash
@@ -274,6 +299,8 @@ class StakingPool:
         # Update totals
         stake_type = stake.stake_type
         self._total_staked[stake_type] -= withdrawable
+        self._total_staked_all -= withdrawable
+        self._agent_collateral[stake.agent_id] -= withdrawable
         
         self._logger.info(
             "stake_withdrawn",
@@ -294,13 +321,12 @@ class StakingPool:
         status: str | None = None,
     ) -> list[Stake]:
         """Get all stakes for an agent."""
-        stake_ids = self._agent_stakes.get(agent_id, [])
-        stakes = [self._stakes[sid] for sid in stake_ids if sid in self._stakes]
+        stakes = self._agent_stakes.get(agent_id, [])
         
         if status:
-            stakes = [s for s in stakes if s.status == status]
+            return [s for s in stakes if s.status == status]
         
-        return stakes
+        return list(stakes)
     
     async def get_total_staked(
         self,
@@ -309,7 +335,7 @@ class StakingPool:
         """Get total amount staked."""
         if stake_type:
             return self._total_staked.get(stake_type, Decimal("0"))
-        return sum(self._total_staked.values(), Decimal("0"))
+        return self._total_staked_all
     
     async def get_slashing_history(
         self,
@@ -317,10 +343,10 @@ class StakingPool:
         limit: int = 100,
     ) -> list[SlashingEvent]:
         """Get slashing history."""
-        events = self._slashing_events
-        
         if agent_id:
-            events = [e for e in events if e.agent_id == agent_id]
+            events = self._agent_slashing_events.get(agent_id, [])
+        else:
+            events = self._slashing_events
         
         return events[-limit:]
     
@@ -340,18 +366,15 @@ class StakingPool:
         if not eligible_agents or self._reward_pool == 0:
             return {}
         
-        reward_per_agent = self._reward_pool / len(eligible_agents)
-        
-        rewards = {}
-        for agent_id in eligible_agents:
-            rewards[agent_id] = reward_per_agent
+        total_rewards = self._reward_pool
+        rewards = dict.fromkeys(eligible_agents, total_rewards / len(eligible_agents))
         
         self._reward_pool = Decimal("0")
         
         self._logger.info(
             "rewards_distributed",
             eligible_agents=len(eligible_agents),
-            total_rewards=self._reward_pool,
+            total_rewards=total_rewards,
         )
         
         return rewards
@@ -367,7 +390,6 @@ class StakingPool:
             agent_id: Agent to check
             
         Returns:
-            Total staked amount
+            Total unslashed amount of active stakes
         """
-        stakes = await self.get_agent_stakes(agent_id, status="active")
-        return sum(s.amount - s.slash_amount for s in stakes)
+        return self._agent_collateral.get(agent_id, Decimal("0"))
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import hashlib
 import json
 import time
+from collections import deque
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from typing import Any
@@ -15,6 +18,9 @@ from agent_infrastructure_platform.common.types import AgentID, TaskID
 
 logger = structlog.get_logger()
 
+# Upper bound on the delay between retries while the storage backend fails
+_MAX_FLUSH_BACKOFF = 5.0
+
 
 @dataclass
 class AuditEvent:
@@ -74,6 +80,11 @@ class AuditLogger:
     - Efficient querying
     - Compliance-ready exports
     
+    Events are hashed and chained as they are logged, but written to the
+    storage backend in batches by a background task, so logging never waits
+    on storage. Queries flush pending events first; call ``flush()`` before
+    shutdown.
+    
     Example:
         ```python
         audit = AuditLogger()
@@ -99,11 +110,26 @@ class AuditLogger:
         ```
     """
 
-    def __init__(self, storage_backend: Any | None = None) -> None:
+    def __init__(
+        self,
+        storage_backend: Any | None = None,
+        flush_interval: float = 0.1,
+        flush_batch_size: int = 256,
+    ) -> None:
         self.storage = storage_backend or []
+        self.flush_interval = flush_interval
+        self.flush_batch_size = flush_batch_size
+        
         self._last_hash: str | None = None
         self._event_count = 0
         
+        # Events logged but not yet written to storage
+        self._buffer: deque[AuditEvent] = deque()
+        self._flush_requested = asyncio.Event()
+        self._flush_task: asyncio.Task[None] | None = None
+        self._flush_lock = asyncio.Lock()
+        self._closing = False
+        
         self._logger = logger
     
     async def log(
@@ -158,8 +184,9 @@ class AuditLogger:
         event.event_hash = event.compute_hash()
         self._last_hash = event.event_hash
         
-        # Store event
-        await self._store(event)
+        # Buffer event for the background flusher
+        self._buffer.append(event)
+        self._schedule_flush()
         
         self._event_count += 1
         
@@ -172,13 +199,82 @@ class AuditLogger:
         
         return event
     
-    async def _store(self, event: AuditEvent) -> None:
-        """Store event in backend."""
+    def _schedule_flush(self) -> None:
+        """Ensure the background flusher is running."""
+        if len(self._buffer) >= self.flush_batch_size:
+            self._flush_requested.set()
+        
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+    
+    async def _flush_loop(self) -> None:
+        """Write buffered events every flush interval or full batch, until drained."""
+        delay = self.flush_interval
+        while self._buffer:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(
+                    self._flush_requested.wait(),
+                    timeout=delay,
+                )
+            
+            self._flush_requested.clear()
+            
+            try:
+                await self.flush()
+            except Exception as e:
+                self._logger.error(
+                    "audit_flush_failed",
+                    error=str(e),
+                    pending_events=len(self._buffer),
+                )
+                if self._closing:
+                    return  # close() retries once more and reports the error
+                # Failed events stay buffered; back off before retrying
+                delay = min(delay * 2, _MAX_FLUSH_BACKOFF)
+            else:
+                delay = self.flush_interval
+    
+    async def flush(self) -> None:
+        """
+        Write all buffered events to storage.
+        
+        A batch the backend fails to store is put back at the head of the
+        buffer before the error is raised, so no event is dropped.
+        """
+        # One writer at a time keeps batches in log order
+        async with self._flush_lock:
+            while self._buffer:
+                count = min(len(self._buffer), self.flush_batch_size)
+                batch = [self._buffer.popleft() for _ in range(count)]
+                try:
+                    await self._store_batch(batch)
+                except BaseException:
+                    self._buffer.extendleft(reversed(batch))
+                    raise
+    
+    async def _store_batch(self, events: list[AuditEvent]) -> None:
+        """Store events in backend."""
         if isinstance(self.storage, list):
-            self.storage.append(event)
+            self.storage.extend(events)
         else:
             # Assume storage backend
-            await self.storage.store(f"audit:{event.id}", event)
+            for event in events:
+                await self.storage.store(f"audit:{event.id}", event)
+    
+    async def close(self) -> None:
+        """Flush pending events and stop the background flusher."""
+        self._closing = True
+        try:
+            if self._flush_task is not None:
+                # Wake the flusher so it drains and exits rather than being
+                # cancelled part way through a batch
+                self._flush_requested.set()
+                await self._flush_task
+                self._flush_task = None
+            
+            await self.flush()
+        finally:
+            self._closing = False
     
     async def query(
         self,
@@ -207,6 +303,8 @@ class AuditLogger:
         Returns:
             Matching events
         """
+        await self.flush()
+        
         events = []
         
         if isinstance(self.storage, list):
@@ -241,6 +339,8 @@ class AuditLogger:
         Returns:
             (is_valid, first_broken_event_id or None)
         """
+        await self.flush()
+        
         if isinstance(self.storage, list):
             events = sorted(self.storage, key=lambda e: e.timestamp)
         else:
@@ -328,5 +428,6 @@ class AuditLogger:
         """Get audit logger statistics."""
         return {
             "total_events": self._event_count,
+            "pending_events": len(self._buffer),
             "last_hash": self._last_hash,
         }
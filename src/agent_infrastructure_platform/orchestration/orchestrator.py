@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable
+import itertools
+from collections import defaultdict
+from collections.abc import AsyncIterator, Awaitable, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
@@ -13,6 +15,8 @@ import structlog
 
 from agent_infrastructure_platform.common.types import (
     AgentID,
+    Capability,
+    CapabilityCategory,
     Context,
     Task,
     TaskPriority,
@@ -22,6 +26,21 @@ from agent_infrastructure_platform.orchestration.circuit_breaker import CircuitB
 
 logger = structlog.get_logger()
 
+# Relative duration estimates (seconds) used for critical-path priority when a
+# task carries no "estimated_duration_seconds" profile in its metadata
+_CATEGORY_DURATION_ESTIMATES: dict[CapabilityCategory, float] = {
+    CapabilityCategory.COGNITIVE: 5.0,
+    CapabilityCategory.COMPUTE: 3.0,
+    CapabilityCategory.TOOL: 2.0,
+    CapabilityCategory.DATA: 1.0,
+    CapabilityCategory.COMMUNICATION: 0.5,
+    CapabilityCategory.SECURITY: 0.5,
+}
+_DEFAULT_DURATION_ESTIMATE = 1.0
+
+# Maximum number of distinct capability sequences kept as plan templates
+_PLAN_TEMPLATE_CACHE_SIZE = 256
+
 
 @dataclass
 class TaskPlan:
@@ -33,6 +52,7 @@ class TaskPlan:
     tasks: list[Task] = field(default_factory=list)
     dependencies: dict[str, list[str]] = field(default_factory=dict)  # task_id -> dependencies
     parallel_groups: list[list[str]] = field(default_factory=list)  # Groups that can run in parallel
+    priority: dict[str, float] = field(default_factory=dict)  # task_id -> critical-path length
 
 
 @dataclass
@@ -72,8 +92,9 @@ class Orchestrator:
             required_capabilities=["text-generation", "summarization"],
         )
         
-        # Execute
-        results = await orchestrator.execute(plan)
+        # Execute, streaming results as tasks finish
+        async for result in orchestrator.iter_execute(plan):
+            print(result.task_id, result.success)
         ```
     """
 
@@ -89,9 +110,20 @@ class Orchestrator:
         
         # Agent registry
         self._agents: dict[AgentID, Any] = {}  # AgentID -> Agent instance
-        self._agent_capabilities: dict[AgentID, list[str]] = {}
+        self._agent_capabilities: dict[AgentID, frozenset[str]] = {}
         self._agent_health: dict[AgentID, bool] = {}
         
+        # Inverted index: capability name -> agents providing it
+        self._agents_by_capability: dict[str, list[AgentID]] = {}
+        
+        # In-flight task count per agent, used to prefer the least loaded
+        self._agent_load: dict[AgentID, int] = {}
+        
+        # Plan templates: capability sequence -> (task capabilities, priorities)
+        self._plan_templates: dict[
+            tuple[str, ...], tuple[tuple[Capability, ...], tuple[float, ...]]
+        ] = {}
+        
         # Task tracking
         self._active_tasks: dict[str, Task] = {}
         self._task_results: dict[str, ExecutionResult] = {}
@@ -107,19 +139,30 @@ class Orchestrator:
     def register_agent(
         self,
         agent: Any,
-        capabilities: list[str],
+        capabilities: list[str] | None = None,
     ) -> None:
         """
         Register an agent with the orchestrator.
         
         Args:
             agent: Agent instance
-            capabilities: List of capability names
+            capabilities: List of capability names (defaults to the
+                agent's own registered capabilities)
         """
+        if capabilities is None:
+            capabilities = sorted(getattr(agent, "capability_names", ()))
+        
         agent_id = getattr(agent, "id", str(uuid4()))
+        if agent_id in self._agents:
+            self._unindex_agent(agent_id)
+        
         self._agents[agent_id] = agent
-        self._agent_capabilities[agent_id] = capabilities
+        self._agent_capabilities[agent_id] = frozenset(capabilities)
         self._agent_health[agent_id] = True
+        self._agent_load.setdefault(agent_id, 0)
+        
+        for cap in self._agent_capabilities[agent_id]:
+            self._agents_by_capability.setdefault(cap, []).append(agent_id)
         
         if self.enable_circuit_breaker:
             self._circuit_breakers[agent_id] = CircuitBreaker()
@@ -133,9 +176,11 @@ class Orchestrator:
     def unregister_agent(self, agent_id: AgentID) -> bool:
         """Unregister an agent."""
         if agent_id in self._agents:
+            self._unindex_agent(agent_id)
             del self._agents[agent_id]
             del self._agent_capabilities[agent_id]
             del self._agent_health[agent_id]
+            self._agent_load.pop(agent_id, None)
             
             if agent_id in self._circuit_breakers:
                 del self._circuit_breakers[agent_id]
@@ -143,17 +188,40 @@ class Orchestrator:
             return True
         return False
     
+    def _unindex_agent(self, agent_id: AgentID) -> None:
+        """Remove an agent from the capability index."""
+        for cap in self._agent_capabilities.get(agent_id, ()):
+            agent_ids = self._agents_by_capability.get(cap)
+            if agent_ids is None or agent_id not in agent_ids:
+                continue
+            agent_ids.remove(agent_id)
+            if not agent_ids:
+                del self._agents_by_capability[cap]
+    
     def find_agents_for_task(self, required_capabilities: list[str]) -> list[AgentID]:
         """
         Find agents that can handle required capabilities.
         
-        Returns agents sorted by health and circuit breaker state.
+        Candidates come from the capability index rather than a scan of all
+        agents. Unhealthy agents and open circuit breakers are skipped, and
+        the rest are returned least loaded first.
         """
+        if required_capabilities:
+            postings = [
+                self._agents_by_capability.get(cap, ()) for cap in required_capabilities
+            ]
+            # Walk the rarest capability's agents, check the rest by set
+            pool = min(postings, key=len)
+            required = set(required_capabilities)
+        else:
+            pool = self._agents.keys()
+            required = set()
+        
         candidates = []
         
-        for agent_id, capabilities in self._agent_capabilities.items():
+        for agent_id in pool:
             # Check if agent has all required capabilities
-            if not all(cap in capabilities for cap in required_capabilities):
+            if len(required) > 1 and not required.issubset(self._agent_capabilities[agent_id]):
                 continue
             
             # Check health
@@ -168,6 +236,8 @@ class Orchestrator:
             
             candidates.append(agent_id)
         
+        # Stable sort keeps registration order among equally loaded agents
+        candidates.sort(key=lambda agent_id: self._agent_load.get(agent_id, 0))
         return candidates
     
     async def create_plan(
@@ -181,17 +251,32 @@ class Orchestrator:
         
         In a production system, this would use an LLM or planner
         to decompose the goal into subtasks.
+        
+        The validated capabilities and critical-path priorities depend only
+        on the capability sequence, so they are cached as a template and
+        repeat requests just stamp out tasks with fresh IDs.
         """
+        key = tuple(required_capabilities)
+        template = self._plan_templates.get(key)
+        
+        if template is None:
+            capabilities = tuple(
+                Capability(name=name, category=CapabilityCategory.TOOL, version="1.0.0")
+                for name in key
+            )
+        else:
+            capabilities = template[0]
+        
         # Simplified planning: create linear sequence
         plan = TaskPlan(name=f"Plan for: {goal[:50]}")
         
         # Create tasks for each capability
-        for i, capability in enumerate(required_capabilities):
+        for i, capability in enumerate(capabilities):
             task = Task(
                 id=f"task-{i}-{uuid4().hex[:8]}",
-                name=f"Execute {capability}",
-                goal=f"Use {capability} capability",
-                required_capabilities=[{"name": capability, "category": "tool", "version": "1.0.0"}],
+                name=f"Execute {capability.name}",
+                goal=f"Use {capability.name} capability",
+                required_capabilities=[capability],
             )
             plan.tasks.append(task)
             
@@ -199,8 +284,75 @@ class Orchestrator:
             if i > 0:
                 plan.dependencies[task.id] = [plan.tasks[i-1].id]
         
+        if template is None:
+            _, plan.priority = self._compute_schedule(plan)
+            
+            if len(self._plan_templates) >= _PLAN_TEMPLATE_CACHE_SIZE:
+                del self._plan_templates[next(iter(self._plan_templates))]
+            self._plan_templates[key] = (
+                capabilities,
+                tuple(plan.priority[task.id] for task in plan.tasks),
+            )
+        else:
+            plan.priority = {
+                task.id: priority for task, priority in zip(plan.tasks, template[1])
+            }
+        
         return plan
     
+    @staticmethod
+    def _estimate_duration(task: Task) -> float:
+        """Estimate task duration from its profile or capability categories."""
+        estimate = task.metadata.get("estimated_duration_seconds")
+        if estimate is not None:
+            return float(estimate)
+        return max(
+            (
+                _CATEGORY_DURATION_ESTIMATES.get(cap.category, _DEFAULT_DURATION_ESTIMATE)
+                for cap in task.required_capabilities
+            ),
+            default=_DEFAULT_DURATION_ESTIMATE,
+        )
+    
+    def _compute_schedule(self, plan: TaskPlan) -> tuple[list[str], dict[str, float]]:
+        """
+        Topologically sort a plan and annotate critical-path lengths.
+        
+        Uses Kahn's algorithm (O(V+E)). The critical-path length of a task is
+        its own estimated duration plus the longest critical path among the
+        tasks that depend on it. Tasks caught in a cycle are left out of the
+        order and get a priority of zero.
+        
+        Returns:
+            Tuple of (topological order, task_id -> critical-path length)
+        """
+        tasks_by_id = {task.id: task for task in plan.tasks}
+        indegree = {
+            task.id: len(plan.dependencies.get(task.id, ()))
+            for task in plan.tasks
+        }
+        children: defaultdict[str, list[str]] = defaultdict(list)
+        for task_id, deps in plan.dependencies.items():
+            for dep in deps:
+                children[dep].append(task_id)
+        
+        order = [task_id for task_id, degree in indegree.items() if not degree]
+        for task_id in order:  # order grows while iterating
+            for child in children.get(task_id, ()):
+                if child in indegree:
+                    indegree[child] -= 1
+                    if not indegree[child]:
+                        order.append(child)
+        
+        cp_length: dict[str, float] = dict.fromkeys(tasks_by_id, 0.0)
+        for task_id in reversed(order):
+            cp_length[task_id] = self._estimate_duration(tasks_by_id[task_id]) + max(
+                (cp_length.get(child, 0.0) for child in children.get(task_id, ())),
+                default=0.0,
+            )
+        
+        return order, cp_length
+    
     async def execute(
         self,
         plan: TaskPlan,
@@ -218,8 +370,67 @@ class Orchestrator:
         Returns:
             Mapping of task_id to result
         """
-        context = context or Context()
-        results: dict[str, ExecutionResult] = {}
+        return {
+            result.task_id: result
+            async for result in self.iter_execute(plan, context, on_progress)
+        }
+    
+    async def iter_execute(
+        self,
+        plan: TaskPlan,
+        context: Context | None = None,
+        on_progress: Callable[[str, ExecutionResult], Awaitable[None]] | None = None,
+    ) -> AsyncIterator[ExecutionResult]:
+        """
+        Execute a task plan, yielding results as tasks finish.
+        
+        Results pass through a queue bounded at twice ``max_concurrent_tasks``,
+        so a slow consumer applies backpressure instead of results piling up
+        in memory. To stop early, iterate under ``contextlib.aclosing`` so the
+        remaining tasks are cancelled as soon as the loop exits.
+        
+        Args:
+            plan: Execution plan
+            context: Execution context
+            on_progress: Callback for progress updates
+            
+        Yields:
+            Execution result of each task in completion order
+        """
+        results: asyncio.Queue[ExecutionResult | None] = asyncio.Queue(
+            maxsize=self.max_concurrent_tasks * 2
+        )
+        
+        closing = False
+        
+        async def produce() -> None:
+            try:
+                await self._run_plan(plan, context or Context.current(), on_progress, results)
+            finally:
+                # Always wake the consumer, even when the scheduler failed; no
+                # sentinel only when the consumer went away and cancelled us
+                if not closing:
+                    await results.put(None)
+        
+        producer = asyncio.create_task(produce())
+        try:
+            while (result := await results.get()) is not None:
+                yield result
+            await producer  # Surface scheduler errors
+        finally:
+            if not producer.done():
+                closing = True
+                producer.cancel()
+                await asyncio.gather(producer, return_exceptions=True)
+    
+    async def _run_plan(
+        self,
+        plan: TaskPlan,
+        context: Context,
+        on_progress: Callable[[str, ExecutionResult], Awaitable[None]] | None,
+        results: asyncio.Queue[ExecutionResult | None],
+    ) -> None:
+        """Schedule a plan's tasks and publish each result to the queue."""
         completed: set[str] = set()
         failed: set[str] = set()
         
@@ -229,62 +440,49 @@ class Orchestrator:
             task_count=len(plan.tasks),
         )
         
-        # Build dependency graph
-        dependents: dict[str, list[str]] = {}  # task_id -> tasks that depend on it
+        # Build dependency graph: pending dependency counters plus the
+        # inverted edges used to unblock children as soon as a parent finishes
+        tasks_by_id = {task.id: task for task in plan.tasks}
+        pending: dict[str, int] = {
+            task.id: len(plan.dependencies.get(task.id, ()))
+            for task in plan.tasks
+        }
+        children: defaultdict[str, list[str]] = defaultdict(list)
         for task_id, deps in plan.dependencies.items():
+            if task_id not in tasks_by_id:
+                continue  # Dependencies of tasks outside the plan never run
             for dep in deps:
-                if dep not in dependents:
-                    dependents[dep] = []
-                dependents[dep].append(task_id)
+                children[dep].append(task_id)
         
-        # Track pending dependencies
-        pending_deps: dict[str, set[str]] = {
-            task.id: set(plan.dependencies.get(task.id, []))
-            for task in plan.tasks
-        }
+        # Ready queue ordered by descending critical-path length (ties keep
+        # plan order); a ``None`` task is the sentinel that wakes the scheduler
+        # once nothing is queued and nothing is in flight
+        priority = plan.priority or self._compute_schedule(plan)[1]
+        sequence = itertools.count()
+        ready: asyncio.PriorityQueue[tuple[float, int, Task | None]] = asyncio.PriorityQueue()
         
-        # Execute tasks as dependencies are satisfied
-        while len(completed) + len(failed) < len(plan.tasks):
-            # Find tasks ready to execute
-            ready = [
-                task for task in plan.tasks
-                if task.id not in completed and task.id not in failed
-                and not pending_deps.get(task.id, set())
-            ]
-            
-            if not ready:
-                # Check for deadlock
-                remaining = [
-                    task for task in plan.tasks
-                    if task.id not in completed and task.id not in failed
-                ]
-                if remaining:
-                    self._logger.error("dependency_deadlock", remaining=[t.id for t in remaining])
-                    for task in remaining:
-                        failed.add(task.id)
-                        results[task.id] = ExecutionResult(
-                            task_id=task.id,
-                            success=False,
-                            error="Dependency deadlock",
-                        )
-                break
-            
-            # Execute ready tasks in parallel
-            tasks_to_run = ready[:self.max_concurrent_tasks]
-            coros = [self._execute_task(task, context) for task in tasks_to_run]
-            task_results = await asyncio.gather(*coros, return_exceptions=True)
-            
-            # Process results
-            for task, result in zip(tasks_to_run, task_results):
-                if isinstance(result, Exception):
+        def enqueue(task: Task | None) -> None:
+            key = -priority.get(task.id, 0.0) if task is not None else 0.0
+            ready.put_nowait((key, next(sequence), task))
+        
+        for task in plan.tasks:
+            if not pending[task.id]:
+                enqueue(task)
+        in_flight = 0
+        held = 0
+        
+        async def run(task: Task) -> None:
+            nonlocal in_flight, held
+            try:
+                try:
+                    result = await self._execute_task(task, context)
+                except Exception as e:
                     result = ExecutionResult(
                         task_id=task.id,
                         success=False,
-                        error=str(result),
+                        error=str(e),
                     )
                 
-                results[task.id] = result
-                
                 if result.success:
                     completed.add(task.id)
                 else:
@@ -294,10 +492,56 @@ class Orchestrator:
                 if on_progress:
                     await on_progress(task.id, result)
                 
-                # Update dependencies for dependent tasks
-                for dependent in dependents.get(task.id, []):
-                    if task.id in pending_deps.get(dependent, set()):
-                        pending_deps[dependent].remove(task.id)
+                # Unblock dependent tasks whose last dependency just finished
+                for child in children.get(task.id, ()):
+                    pending[child] -= 1
+                    if not pending[child]:
+                        enqueue(tasks_by_id[child])
+                
+                await results.put(result)
+            finally:
+                held -= 1
+                self._semaphore.release()
+                in_flight -= 1
+                if not in_flight and ready.empty():
+                    enqueue(None)
+        
+        # Dispatch tasks the moment they become ready. The slot is taken before
+        # the coroutine is created, so at most max_concurrent_tasks exist at once
+        # (across all plans), and a full results queue holds slots until drained.
+        # A task cancelled before its first step never reaches its ``finally``,
+        # so slots still held once the group exits are handed back here
+        if not ready.empty():
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    while (task := (await ready.get())[2]) is not None:
+                        in_flight += 1
+                        await self._semaphore.acquire()
+                        held += 1
+                        tg.create_task(run(task))
+            except ExceptionGroup as group:
+                # Agent errors are caught per task, so this is a failing
+                # on_progress callback; raise it as the caller wrote it
+                raise group.exceptions[0]
+            finally:
+                for _ in range(held):
+                    self._semaphore.release()
+                held = 0
+        
+        # Anything never dispatched is blocked on a cycle or a missing dependency
+        remaining = [
+            task for task in plan.tasks
+            if task.id not in completed and task.id not in failed
+        ]
+        if remaining:
+            self._logger.error("dependency_deadlock", remaining=[t.id for t in remaining])
+            for task in remaining:
+                failed.add(task.id)
+                await results.put(ExecutionResult(
+                    task_id=task.id,
+                    success=False,
+                    error="Dependency deadlock",
+                ))
         
         self._logger.info(
             "plan_execution_completed",
@@ -305,8 +549,6 @@ class Orchestrator:
             completed=len(completed),
             failed=len(failed),
         )
-        
-        return results
     
     async def _execute_task(
         self,
@@ -316,34 +558,38 @@ class Orchestrator:
         """Execute a single task."""
         start_time = asyncio.get_event_loop().time()
         
-        async with self._semaphore:
-            # Find capable agent
-            required_caps = [c.name for c in task.required_capabilities]
-            candidates = self.find_agents_for_task(required_caps)
+        # Find capable agent
+        required_caps = [c.name for c in task.required_capabilities]
+        candidates = self.find_agents_for_task(required_caps)
+        
+        if not candidates:
+            return ExecutionResult(
+                task_id=task.id,
+                success=False,
+                error=f"No agent found for capabilities: {required_caps}",
+            )
+        
+        # Try agents until one succeeds
+        for agent_id in candidates:
+            agent = self._agents[agent_id]
+            cb = self._circuit_breakers.get(agent_id)
             
-            if not candidates:
-                return ExecutionResult(
-                    task_id=task.id,
-                    success=False,
-                    error=f"No agent found for capabilities: {required_caps}",
-                )
+            # Check circuit breaker
+            if cb and not cb.can_execute():
+                continue
             
-            # Try agents until one succeeds
-            for agent_id in candidates:
-                agent = self._agents[agent_id]
-                cb = self._circuit_breakers.get(agent_id)
+            self._agent_load[agent_id] = self._agent_load.get(agent_id, 0) + 1
+            
+            try:
+                # Execute
+                self._active_tasks[task.id] = task
                 
-                try:
-                    # Check circuit breaker
-                    if cb and not cb.can_execute():
-                        continue
-                    
-                    # Execute
-                    self._active_tasks[task.id] = task
-                    
-                    if hasattr(agent, 'execute_task'):
+                # Prefer batched submission, then direct execution
+                dispatch = getattr(agent, "submit", None) or getattr(agent, "execute_task", None)
+                with context.bind():
+                    if dispatch is not None:
                         result_task = await asyncio.wait_for(
-                            agent.execute_task(task, context),
+                            dispatch(task, context),
                             timeout=self.default_timeout,
                         )
                         success = result_task.status == TaskStatus.COMPLETED
@@ -352,45 +598,49 @@ class Orchestrator:
                         # Fallback: call agent directly
                         output = await agent(task.input_data)
                         success = True
-                    
-                    del self._active_tasks[task.id]
-                    
-                    duration = (asyncio.get_event_loop().time() - start_time) * 1000
-                    
-                    # Record success in circuit breaker
-                    if cb:
-                        cb.record_success()
-                    
-                    return ExecutionResult(
-                        task_id=task.id,
-                        success=success,
-                        output=output,
-                        duration_ms=duration,
-                    )
-                    
-                except Exception as e:
-                    self._logger.error(
-                        "task_execution_failed",
-                        task_id=task.id,
-                        agent_id=agent_id,
-                        error=str(e),
-                    )
-                    
-                    # Record failure in circuit breaker
-                    if cb:
-                        cb.record_failure()
-                    
-                    continue
+                
+                del self._active_tasks[task.id]
+                
+                duration = (asyncio.get_event_loop().time() - start_time) * 1000
+                
+                # Record success in circuit breaker
+                if cb:
+                    cb.record_success()
+                
+                return ExecutionResult(
+                    task_id=task.id,
+                    success=success,
+                    output=output,
+                    duration_ms=duration,
+                )
+                
+            except Exception as e:
+                self._logger.error(
+                    "task_execution_failed",
+                    task_id=task.id,
+                    agent_id=agent_id,
+                    error=str(e),
+                )
+                
+                # Record failure in circuit breaker
+                if cb:
+                    cb.record_failure()
+                
+                continue
             
-            # All agents failed
-            duration = (asyncio.get_event_loop().time() - start_time) * 1000
-            return ExecutionResult(
-                task_id=task.id,
-                success=False,
-                error="All agents failed to execute task",
-                duration_ms=duration,
-                retry_count=len(candidates),
-            )
+            finally:
+                if agent_id in self._agent_load:
+                    self._agent_load[agent_id] -= 1
+        
+        # All agents failed
+        duration = (asyncio.get_event_loop().time() - start_time) * 1000
+        return ExecutionResult(
+            task_id=task.id,
+            success=False,
+            error="All agents failed to execute task",
+            duration_ms=duration,
+            retry_count=len(candidates),
+        )
     
     async def cancel_task(self, task_id: str) -> bool:
         """Cancel an active task."""
@@ -5,6 +5,7 @@ from agent_infrastructure_platform.protocols.mcp.server import MCPServer
 from agent_infrastructure_platform.protocols.a2a.protocol import A2AProtocol
 from agent_infrastructure_platform.protocols.acp.protocol import ACPProtocol
 from agent_infrastructure_platform.protocols.anp.protocol import ANPProtocol
+from agent_infrastructure_platform.protocols.http import close_shared_transport
 
 __all__ = [
     "MCPClient",
@@ -12,4 +13,5 @@ __all__ = [
     "A2AProtocol",
     "ACPProtocol",
     "ANPProtocol",
+    "close_shared_transport",
 ]
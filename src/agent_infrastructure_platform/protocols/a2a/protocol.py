@@ -35,6 +35,11 @@ from agent_infrastructure_platform.protocols.a2a.types import (
     TaskStatusUpdateEvent,
     TextPart,
 )
+from agent_infrastructure_platform.protocols.http import (
+    JSON_HEADERS,
+    acquire_shared_transport,
+    release_shared_transport,
+)
 
 logger = structlog.get_logger()
 
@@ -101,6 +106,7 @@ class A2AProtocol:
         
         # HTTP client for outgoing requests
         self._client: httpx.AsyncClient | None = None
+        self._transport: httpx.AsyncHTTPTransport | None = None
         
         # FastAPI app for server mode
         self._app: FastAPI | None = None
@@ -370,13 +376,15 @@ class A2AProtocol:
     
     async def connect(self) -> None:
         """Initialize HTTP client for outgoing requests."""
-        self._client = httpx.AsyncClient(timeout=60.0)
+        self._transport = acquire_shared_transport()
+        self._client = httpx.AsyncClient(timeout=60.0, transport=self._transport)
     
     async def disconnect(self) -> None:
-        """Close HTTP client."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """Release HTTP client and its hold on the shared pool."""
+        self._client = None
+        if self._transport is not None:
+            transport, self._transport = self._transport, None
+            await release_shared_transport(transport)
     
     def _ensure_connected(self) -> httpx.AsyncClient:
         """Ensure client is connected."""
@@ -403,7 +411,7 @@ class A2AProtocol:
         response = await client.get(discovery_url)
         response.raise_for_status()
         
-        return AgentCard(**response.json())
+        return AgentCard.model_validate_json(response.content)
     
     @trace_span()
     @retry_with_backoff(max_attempts=3, exceptions=(httpx.HTTPError,))
@@ -438,11 +446,12 @@ class A2AProtocol:
         
         response = await client.post(
             agent_url,
-            json=request.model_dump(),
+            content=request.model_dump_json(),
+            headers=JSON_HEADERS,
         )
         response.raise_for_status()
         
-        result = SendTaskResponse(**response.json())
+        result = SendTaskResponse.model_validate_json(response.content)
         
         if result.error:
             raise A2AError(f"Task failed: {result.error.message}")
@@ -478,11 +487,12 @@ class A2AProtocol:
         
         response = await client.post(
             agent_url,
-            json=request.model_dump(),
+            content=request.model_dump_json(),
+            headers=JSON_HEADERS,
         )
         response.raise_for_status()
         
-        result = GetTaskResponse(**response.json())
+        result = GetTaskResponse.model_validate_json(response.content)
         
         if result.error:
             raise A2AError(f"Get task failed: {result.error.message}")
@@ -510,11 +520,12 @@ class A2AProtocol:
         
         response = await client.post(
             agent_url,
-            json=request.model_dump(),
+            content=request.model_dump_json(),
+            headers=JSON_HEADERS,
         )
         response.raise_for_status()
         
-        result = CancelTaskResponse(**response.json())
+        result = CancelTaskResponse.model_validate_json(response.content)
         
         if result.error:
             raise A2AError(f"Cancel task failed: {result.error.message}")
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import builtins
 from datetime import datetime
 from typing import Any, Literal
 from uuid import UUID, uuid4
@@ -121,7 +122,8 @@ class FileContent(BaseModel):
 
     name: str | None = None
     mime_type: str | None = None
-    bytes: bytes | None = None
+    # Spelled via builtins: the field name shadows the type in the class body
+    bytes: builtins.bytes | None = None
     uri: str | None = None
 
     model_config = ConfigDict(frozen=True)
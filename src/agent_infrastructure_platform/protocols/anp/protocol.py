@@ -13,6 +13,11 @@ from pydantic import BaseModel, ConfigDict, Field
 from agent_infrastructure_platform.common.decorators import retry_with_backoff, trace_span
 from agent_infrastructure_platform.common.exceptions import ANPError
 from agent_infrastructure_platform.common.types import AgentID, Capability, JSON
+from agent_infrastructure_platform.protocols.http import (
+    JSON_HEADERS,
+    acquire_shared_transport,
+    release_shared_transport,
+)
 
 logger = structlog.get_logger()
 
@@ -152,6 +157,7 @@ class ANPProtocol:
         
         # HTTP client
         self._client: httpx.AsyncClient | None = None
+        self._transport: httpx.AsyncHTTPTransport | None = None
         
         # Validation handlers
         self._register_validators: list[callable] = []
@@ -167,13 +173,15 @@ class ANPProtocol:
     
     async def connect(self) -> None:
         """Initialize HTTP client."""
-        self._client = httpx.AsyncClient(timeout=30.0)
+        self._transport = acquire_shared_transport()
+        self._client = httpx.AsyncClient(timeout=30.0, transport=self._transport)
     
-    async func disconnect(self) -> None:
-        """Close HTTP client."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+    async def disconnect(self) -> None:
+        """Release HTTP client and its hold on the shared pool."""
+        self._client = None
+        if self._transport is not None:
+            transport, self._transport = self._transport, None
+            await release_shared_transport(transport)
     
     def _ensure_connected(self) -> httpx.AsyncClient:
         """Ensure client is connected."""
@@ -370,8 +378,11 @@ class ANPProtocol:
         
         query = query or AgentQuery()
         
+        # Encoded once, used for both the cache key and the request body
+        body = query.model_dump_json()
+        
         # Check cache
-        cache_key = f"{url}:{query.model_dump_json()}"
+        cache_key = f"{url}:{body}"
         if use_cache and cache_key in self._cache:
             result, cached_at = self._cache[cache_key]
             age = (datetime.utcnow() - cached_at).total_seconds()
@@ -384,11 +395,12 @@ class ANPProtocol:
         
         response = await client.post(
             f"{url}/anp/discover",
-            json=query.model_dump(),
+            content=body,
+            headers=JSON_HEADERS,
         )
         response.raise_for_status()
         
-        result = DiscoveryResult(**response.json())
+        result = DiscoveryResult.model_validate_json(response.content)
         
         # Update cache
         if use_cache:
@@ -491,7 +503,8 @@ class ANPProtocol:
         
         response = await client.post(
             f"{url}/anp/register",
-            json=entry.model_dump(),
+            content=entry.model_dump_json(),
+            headers=JSON_HEADERS,
         )
         response.raise_for_status()
         
@@ -0,0 +1,75 @@
+"""Shared HTTP connection pool for protocol clients."""
+
+from __future__ import annotations
+
+import asyncio
+import weakref
+from dataclasses import dataclass
+
+import httpx
+
+# Connection limits for the process-wide pool
+HTTP_LIMITS = httpx.Limits(
+    max_connections=200,
+    max_keepalive_connections=50,
+    keepalive_expiry=30.0,
+)
+
+# Request bodies are pre-encoded by pydantic, so the content type is set explicitly
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+@dataclass
+class _SharedTransport:
+    """A loop's connection pool and the number of clients using it."""
+
+    transport: httpx.AsyncHTTPTransport
+    users: int = 0
+
+
+# Pooled connections belong to the event loop that opened them
+_transports: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _SharedTransport] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def acquire_shared_transport() -> httpx.AsyncHTTPTransport:
+    """
+    Get the connection pool shared by protocol clients on the running loop.
+
+    Clients keep their own timeout and headers but pass this as their
+    ``transport``, so keep-alive connections to the same agent are reused
+    across MCP, A2A and ANP clients instead of each paying a new handshake.
+    Clients must not close it; each acquire is paired with a
+    ``release_shared_transport()`` call, and the last release closes it.
+
+    Returns:
+        Shared transport for the current event loop
+    """
+    loop = asyncio.get_running_loop()
+    shared = _transports.get(loop)
+    if shared is None:
+        shared = _transports[loop] = _SharedTransport(
+            httpx.AsyncHTTPTransport(limits=HTTP_LIMITS)
+        )
+    shared.users += 1
+    return shared.transport
+
+
+async def release_shared_transport(transport: httpx.AsyncHTTPTransport) -> None:
+    """Give back a transport from ``acquire_shared_transport()``, closing it when unused."""
+    loop = asyncio.get_running_loop()
+    shared = _transports.get(loop)
+    if shared is None or shared.transport is not transport:
+        return  # Already closed by close_shared_transport()
+    shared.users -= 1
+    if not shared.users:
+        del _transports[loop]
+        await transport.aclose()
+
+
+async def close_shared_transport() -> None:
+    """Close the shared connection pool for the running loop, whoever still uses it."""
+    shared = _transports.pop(asyncio.get_running_loop(), None)
+    if shared is not None:
+        await shared.transport.aclose()
@@ -11,6 +11,11 @@ from pydantic import BaseModel
 from agent_infrastructure_platform.common.decorators import retry_with_backoff, trace_span
 from agent_infrastructure_platform.common.exceptions import MCPError
 from agent_infrastructure_platform.common.types import JSON
+from agent_infrastructure_platform.protocols.http import (
+    JSON_HEADERS,
+    acquire_shared_transport,
+    release_shared_transport,
+)
 from agent_infrastructure_platform.protocols.mcp.types import (
     MCPError as MCPErrorResponse,
     MCPRequest,
@@ -56,6 +61,7 @@ class MCPClient:
         self.headers = headers or {}
         
         self._client: httpx.AsyncClient | None = None
+        self._transport: httpx.AsyncHTTPTransport | None = None
         self._server_info: MCPServerInfo | None = None
         self._logger = logger.bind(client_url=base_url)
     
@@ -68,13 +74,19 @@ class MCPClient:
     
     async def connect(self) -> None:
         """Connect to the MCP server."""
+        self._transport = acquire_shared_transport()
         self._client = httpx.AsyncClient(
             timeout=self.timeout,
             headers=self.headers,
+            transport=self._transport,
         )
         
         # Fetch server info
-        self._server_info = await self.get_server_info()
+        try:
+            self._server_info = await self.get_server_info()
+        except BaseException:
+            await self.disconnect()
+            raise
         self._logger.info(
             "mcp_client_connected",
             server_name=self._server_info.name,
@@ -84,9 +96,12 @@ class MCPClient:
     async def disconnect(self) -> None:
         """Disconnect from the MCP server."""
         if self._client:
-            await self._client.aclose()
+            # The shared pool closes once its last client lets go
             self._client = None
             self._logger.info("mcp_client_disconnected")
+        if self._transport is not None:
+            transport, self._transport = self._transport, None
+            await release_shared_transport(transport)
     
     def _ensure_connected(self) -> httpx.AsyncClient:
         """Ensure client is connected."""
@@ -100,7 +115,7 @@ class MCPClient:
         client = self._ensure_connected()
         response = await client.get(f"{self.base_url}/mcp/info")
         response.raise_for_status()
-        return MCPServerInfo(**response.json())
+        return MCPServerInfo.model_validate_json(response.content)
     
     @trace_span()
     @retry_with_backoff(max_attempts=3, exceptions=(httpx.HTTPError,))
@@ -133,11 +148,12 @@ class MCPClient:
         
         response = await client.post(
             f"{self.base_url}/mcp/resources/read",
-            json=request.model_dump(),
+            content=request.model_dump_json(),
+            headers=JSON_HEADERS,
         )
         response.raise_for_status()
         
-        return MCPResourceResponse(**response.json())
+        return MCPResourceResponse.model_validate_json(response.content)
     
     @trace_span()
     @retry_with_backoff(max_attempts=3, exceptions=(httpx.HTTPError,))
@@ -172,11 +188,12 @@ class MCPClient:
         
         response = await client.post(
             f"{self.base_url}/mcp/tools/call",
-            json=request.model_dump(),
+            content=request.model_dump_json(),
+            headers=JSON_HEADERS,
         )
         response.raise_for_status()
         
-        return MCPToolResponse(**response.json())
+        return MCPToolResponse.model_validate_json(response.content)
     
     @trace_span()
     @retry_with_backoff(max_attempts=3, exceptions=(httpx.HTTPError,))
@@ -0,0 +1,119 @@
+"""Tests for sandboxed code execution."""
+
+import asyncio
+
+import pytest
+
+from agent_infrastructure_platform.compute.sandbox import Sandbox, SandboxConfig, SandboxPool
+from agent_infrastructure_platform.compute.tee import _result_hash
+
+
+class TestSandboxValidation:
+    """Test AST validation."""
+
+    def test_deeply_nested_code_is_validated(self):
+        """Test that deep expressions are checked without exhausting the stack."""
+        sandbox = Sandbox()
+        code = "x = 1\ny = " + " + ".join(["x"] * 1500) + "\nopen('secrets.txt')"
+
+        result = sandbox.execute(code)
+
+        assert not result.success
+        assert result.error_type == "SecurityError"
+        assert "file_operation_not_allowed" in result.security_violations
+
+    def test_node_limit_applies_to_deep_code(self):
+        """Test that deep code over the node limit is rejected as too complex."""
+        sandbox = Sandbox(SandboxConfig(max_ast_nodes=5000))
+        code = "x = 1\ny = " + " + ".join(["x"] * 1500)
+
+        result = sandbox.execute(code)
+
+        assert not result.success
+        assert result.security_violations == ["too_complex"]
+
+    def test_blocked_imports_and_builtins(self):
+        """Test that disallowed imports and builtins are reported."""
+        sandbox = Sandbox(SandboxConfig(allowed_modules=["math"]))
+
+        valid, violations = sandbox.validate("import os\nfrom math import sqrt\neval('1')")
+
+        assert not valid
+        assert violations == ["import_not_allowed:os", "blocked_builtin:eval"]
+
+
+@pytest.mark.asyncio
+class TestSandboxPool:
+    """Test the warm worker pool."""
+
+    async def test_worker_is_reused_after_success(self):
+        """Test that a successful run returns its worker to the pool."""
+        pool = SandboxPool(SandboxConfig(allowed_modules=["math"]), size=1)
+        try:
+            first = await pool.execute("result = math.sqrt(16)")
+            pid = pool._workers[0].process.pid
+            second = await pool.execute("result = x * 2", {"x": 21})
+
+            assert first.success and first.result == 4.0
+            assert second.result == 42
+            assert [w.process.pid for w in pool._workers] == [pid]
+        finally:
+            await pool.close()
+
+    async def test_failed_run_recycles_worker(self):
+        """Test that a failing run replaces its worker with a fresh one."""
+        pool = SandboxPool(SandboxConfig(), size=1)
+        try:
+            old = pool._workers[0].process
+
+            failed = await pool.execute("raise ValueError('bad input')")
+            recovered = await pool.execute("result = 1")
+
+            assert failed.error_type == "ValueError"
+            assert recovered.success
+            assert not old.is_alive()
+            assert len(pool._workers) == 1 and pool._workers[0].process is not old
+        finally:
+            await pool.close()
+
+    async def test_cancelled_execute_replaces_worker(self):
+        """Test that cancelling a run keeps the pool at full size."""
+        pool = SandboxPool(SandboxConfig(max_execution_time=5.0), size=1)
+        try:
+            old = pool._workers[0].process
+            running = asyncio.create_task(pool.execute("while True:\n    pass"))
+            await asyncio.sleep(0.1)
+            running.cancel()
+
+            with pytest.raises(asyncio.CancelledError):
+                await running
+            result = await asyncio.wait_for(pool.execute("result = 1"), timeout=10)
+
+            assert result.success
+            assert not old.is_alive()
+            assert pool._idle.qsize() == len(pool._workers) == 1
+        finally:
+            await pool.close()
+
+    async def test_close_stops_workers(self):
+        """Test that closing the pool stops every worker process."""
+        pool = SandboxPool(SandboxConfig(), size=2)
+        processes = [w.process for w in pool._workers]
+
+        await pool.close()
+
+        assert not any(p.is_alive() for p in processes)
+        assert not pool._workers and pool._idle.empty()
+
+
+class TestTEEResultHash:
+    """Test the canonical digest of execution results."""
+
+    def test_digest_is_pinned(self):
+        """Test that results hash as compact sorted-key JSON, whatever their integer sizes."""
+        result = {"b": 1, "a": [1, 2], "big": 2**70, "n": None, "s": "\u00e9"}
+
+        assert _result_hash(result) == (
+            "dc1c830f80e886f40d5c0b03e5e1855d32ffb5e41d9a413f4f4730ea1846f600"
+        )
+        assert _result_hash({"a": [1, 2], "b": 1}) == _result_hash({"b": 1, "a": [1, 2]})
@@ -0,0 +1,143 @@
+"""Tests for common decorators."""
+
+import asyncio
+import time
+
+import pytest
+
+from agent_infrastructure_platform.common.decorators import (
+    RateLimiter,
+    cache_result,
+    retry_with_backoff,
+    singleton,
+)
+from agent_infrastructure_platform.common.exceptions import RetryExhaustedError
+
+
+@pytest.mark.asyncio
+class TestRateLimiter:
+    """Test token bucket rate limiting."""
+
+    async def test_burst_then_refuse(self):
+        """Test that a full bucket allows a burst and then refuses."""
+        limiter = RateLimiter(rate=1.0, burst=3)
+
+        assert [await limiter.acquire() for _ in range(4)] == [True, True, True, False]
+
+    async def test_wait_sleeps_until_refilled(self):
+        """Test that waiters resume once enough tokens have refilled."""
+        limiter = RateLimiter(rate=50.0, burst=1)
+        await limiter.acquire()
+
+        start = time.monotonic()
+        await asyncio.gather(limiter.wait(), limiter.wait())
+        elapsed = time.monotonic() - start
+
+        assert 0.03 <= elapsed < 0.2
+
+    async def test_unsatisfiable_limits_are_rejected(self):
+        """Test that a zero rate or an oversized wait raises instead of hanging."""
+        with pytest.raises(ValueError):
+            RateLimiter(rate=0, burst=1)
+
+        limiter = RateLimiter(rate=1.0, burst=2)
+        with pytest.raises(ValueError):
+            await limiter.wait(3)
+
+
+@pytest.mark.asyncio
+class TestCacheResult:
+    """Test result caching."""
+
+    async def test_hits_and_lru_eviction(self):
+        """Test that results are reused and the least recent entry is evicted."""
+        calls = []
+
+        @cache_result(ttl_seconds=60, maxsize=2)
+        async def square(x, *, offset=0):
+            calls.append(x)
+            return x * x + offset
+
+        assert await square(2) == 4
+        assert await square(2) == 4
+        assert await square(3) == 9
+        assert await square(2) == 4  # Refreshes 2, so 3 is least recent
+        assert await square(4) == 16
+        assert await square(3) == 9
+
+        assert calls == [2, 3, 4, 3]
+
+    async def test_keyword_order_shares_an_entry(self):
+        """Test that the same keyword arguments in any order hit one entry."""
+        calls = []
+
+        @cache_result(ttl_seconds=60)
+        async def area(*, width, height):
+            calls.append((width, height))
+            return width * height
+
+        assert await area(width=2, height=3) == 6
+        assert await area(height=3, width=2) == 6
+
+        assert calls == [(2, 3)]
+
+    async def test_expired_and_unhashable_arguments(self):
+        """Test that entries expire and unhashable arguments are still cached."""
+        calls = []
+
+        @cache_result(ttl_seconds=0.01)
+        async def total(values):
+            calls.append(values)
+            return sum(values)
+
+        assert await total([1, 2]) == 3
+        assert await total([1, 2]) == 3
+        await asyncio.sleep(0.02)
+        assert await total([1, 2]) == 3
+
+        assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+class TestRetryWithBackoff:
+    """Test retry with backoff."""
+
+    async def test_retries_until_success(self):
+        """Test that retryable failures are retried."""
+        attempts = []
+
+        @retry_with_backoff(max_attempts=3, base_delay=0.001, exceptions=(ValueError,))
+        async def flaky():
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise ValueError("transient")
+            return "ok"
+
+        assert await flaky() == "ok"
+        assert len(attempts) == 3
+
+    async def test_exhaustion_raises(self):
+        """Test that exhausting all attempts raises RetryExhaustedError."""
+
+        @retry_with_backoff(max_attempts=2, base_delay=0.001, exceptions=(ValueError,))
+        async def broken():
+            raise ValueError("permanent")
+
+        with pytest.raises(RetryExhaustedError) as exc_info:
+            await broken()
+        assert isinstance(exc_info.value.cause, ValueError)
+
+
+class TestSingleton:
+    """Test the singleton class decorator."""
+
+    def test_returns_same_instance(self):
+        """Test that every call returns the first instance."""
+
+        @singleton
+        class Registry:
+            def __init__(self, name="first"):
+                self.name = name
+
+        assert Registry() is Registry("second")
+        assert Registry().name == "first"
@@ -97,6 +97,20 @@ class TestPolicyEngine:
         assert result.allowed is False
 
 
+class FlakyStorage:
+    """Storage backend that fails a set number of writes before recovering."""
+
+    def __init__(self, failures: int) -> None:
+        self.failures = failures
+        self.events: dict[str, AuditEvent] = {}
+
+    async def store(self, key: str, event: AuditEvent) -> None:
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("storage unavailable")
+        self.events[key] = event
+
+
 @pytest.mark.asyncio
 class TestAuditLogger:
     """Test audit logging."""
@@ -157,6 +171,46 @@ class TestAuditLogger:
         assert "test" in json_export
         assert "agent-1" in json_export
 
+    async def test_events_are_flushed_in_background(self):
+        """Test that logged events reach storage without an explicit query."""
+        audit = AuditLogger(flush_interval=0.01)
+        
+        await audit.log(action="action-1")
+        await audit.log(action="action-2")
+        assert audit.get_stats()["total_events"] == 2
+        
+        await asyncio.sleep(0.05)
+        assert [e.action for e in audit.storage] == ["action-1", "action-2"]
+        assert audit.get_stats()["pending_events"] == 0
+        
+        await audit.close()
+
+    async def test_failed_flush_keeps_events_and_retries(self):
+        """Test that a storage error requeues the batch and the flusher retries."""
+        storage = FlakyStorage(failures=2)
+        audit = AuditLogger(storage_backend=storage, flush_interval=0.01)
+        
+        events = [await audit.log(action=f"action-{i}") for i in range(3)]
+        
+        for _ in range(100):
+            if len(storage.events) == 3:
+                break
+            await asyncio.sleep(0.01)
+        assert list(storage.events) == [f"audit:{e.id}" for e in events]
+        assert audit.get_stats()["pending_events"] == 0
+        
+        await audit.close()
+    
+    async def test_close_reports_unflushed_events(self):
+        """Test that close raises instead of dropping events it cannot store."""
+        audit = AuditLogger(storage_backend=FlakyStorage(failures=1000), flush_interval=0.01)
+        
+        await audit.log(action="action-1")
+        
+        with pytest.raises(ConnectionError):
+            await audit.close()
+        assert audit.get_stats()["pending_events"] == 1
+
 
 @pytest.mark.asyncio
 class TestKillSwitch:
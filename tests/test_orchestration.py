@@ -0,0 +1,421 @@
+"""Tests for orchestration and agent task batching."""
+
+import asyncio
+import contextlib
+
+import pytest
+
+from agent_infrastructure_platform.common.agent import Agent, AgentBatcher, AgentConfig
+from agent_infrastructure_platform.common.exceptions import AgentUnavailableError
+from agent_infrastructure_platform.common.types import (
+    Capability,
+    CapabilityCategory,
+    Context,
+    Task,
+    TaskStatus,
+)
+from agent_infrastructure_platform.orchestration.orchestrator import Orchestrator, TaskPlan
+
+
+class EchoAgent(Agent):
+    """Agent that records batch sizes and echoes task input."""
+
+    def __init__(self, **config) -> None:
+        super().__init__(AgentConfig(name="echo-agent", **config))
+        self.register_capability(Capability(
+            name="echo",
+            category=CapabilityCategory.TOOL,
+        ))
+        self.batch_sizes: list[int] = []
+
+    async def handle_batch(self, tasks, contexts):
+        self.batch_sizes.append(len(tasks))
+        return await super().handle_batch(tasks, contexts)
+
+    async def handle_task(self, task: Task, ctx: Context) -> Task:
+        if task.input_data == "fail":
+            raise RuntimeError("boom")
+        task.output_data = task.input_data
+        return task
+
+    async def handle_message(self, message, ctx):
+        return None
+
+
+def make_task(task_id: str, input_data=None) -> Task:
+    return Task(
+        id=task_id,
+        name=task_id,
+        goal="echo",
+        input_data=input_data,
+        required_capabilities=[Capability(name="echo", category=CapabilityCategory.TOOL)],
+    )
+
+
+@pytest.mark.asyncio
+class TestAgentBatcher:
+    """Test batched task submission."""
+
+    async def test_concurrent_submissions_share_a_batch(self):
+        """Test that tasks submitted together are dispatched as one batch."""
+        agent = EchoAgent(batch_max_wait_ms=20, batch_concurrency=1)
+        await agent.initialize()
+
+        tasks = [make_task(f"t{i}", i) for i in range(5)]
+        results = await asyncio.gather(*(agent.submit(t) for t in tasks))
+
+        assert [r.output_data for r in results] == [0, 1, 2, 3, 4]
+        assert all(r.status == TaskStatus.COMPLETED for r in results)
+        assert agent.batch_sizes == [5]
+        await agent.shutdown()
+
+    async def test_failure_is_isolated_to_its_task(self):
+        """Test that one failing task does not fail the rest of its batch."""
+        agent = EchoAgent(batch_max_wait_ms=5)
+        await agent.initialize()
+
+        ok, bad = await asyncio.gather(
+            agent.submit(make_task("ok", "fine")),
+            agent.submit(make_task("bad", "fail")),
+            return_exceptions=True,
+        )
+
+        assert ok.output_data == "fine"
+        assert isinstance(bad, RuntimeError)
+        await agent.shutdown()
+
+    async def test_lone_task_is_dispatched_without_waiting(self):
+        """Test that a single submission does not sit out the batch window."""
+        agent = EchoAgent(batch_max_wait_ms=200)
+        await agent.initialize()
+
+        start = asyncio.get_running_loop().time()
+        result = await agent.submit(make_task("t", 1))
+        elapsed = asyncio.get_running_loop().time() - start
+
+        assert result.output_data == 1
+        assert elapsed < 0.1
+        await agent.shutdown()
+
+    async def test_shutdown_fails_in_flight_submissions(self):
+        """Test that tasks taken off the queue are failed when the batcher closes."""
+        agent = EchoAgent(batch_max_wait_ms=200)
+        await agent.initialize()
+
+        async def hang(tasks, contexts):
+            await asyncio.sleep(3600)
+
+        agent.handle_batch = hang
+        submission = asyncio.create_task(agent.submit(make_task("t")))
+        await asyncio.sleep(0.01)
+        await agent.shutdown()
+
+        with pytest.raises(AgentUnavailableError):
+            await asyncio.wait_for(submission, timeout=2)
+
+    async def test_wrong_result_count_fails_the_batch(self):
+        """Test that handle_batch returning too few results fails every task."""
+        agent = EchoAgent()
+        await agent.initialize()
+
+        async def short(tasks, contexts):
+            return tasks[:1]
+
+        agent.handle_batch = short
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                agent.submit(make_task("a")),
+                agent.submit(make_task("b")),
+                return_exceptions=True,
+            ),
+            timeout=2,
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+        await agent.shutdown()
+
+    async def test_full_queue_applies_backpressure(self):
+        """Test that submissions wait once max_pending tasks are queued."""
+        agent = EchoAgent()
+        batcher = AgentBatcher(agent, max_batch=1, concurrency=1, max_pending=2)
+        batcher._workers = [asyncio.create_task(asyncio.sleep(3600))]  # Nothing drains
+
+        submissions = [
+            asyncio.create_task(batcher.submit(make_task(f"t{i}"), Context())) for i in range(3)
+        ]
+        await asyncio.sleep(0)
+
+        assert batcher._queue.full()
+        await batcher.close()
+        results = await asyncio.gather(*submissions, return_exceptions=True)
+        assert all(isinstance(r, AgentUnavailableError) for r in results)
+
+
+@pytest.mark.asyncio
+class TestAgentShutdown:
+    """Test agent shutdown."""
+
+    async def test_shutdown_cancels_active_tasks(self):
+        """Test that shutdown cancels running tasks together instead of waiting."""
+        agent = EchoAgent()
+        await agent.initialize()
+
+        async def hang(task, ctx):
+            await asyncio.sleep(3600)
+
+        agent.register_task_handler("slow", hang)
+        slow = [make_task("slow") for _ in range(3)]
+        for i, task in enumerate(slow):
+            task.id = f"slow-{i}"
+        running = [asyncio.create_task(agent.execute_task(t)) for t in slow]
+        await asyncio.sleep(0)
+
+        await asyncio.wait_for(agent.shutdown(timeout=1.0), timeout=1.0)
+
+        assert all(r.cancelled() for r in running)
+        assert all(t.status == TaskStatus.CANCELLED for t in slow)
+        assert not agent._running_tasks
+
+    async def test_task_cancelled_while_queued_is_unregistered(self):
+        """Test that a task cancelled before getting a slot leaves no entries behind."""
+        agent = EchoAgent(max_concurrent_tasks=1)
+        await agent.initialize()
+
+        async def hang(task, ctx):
+            await asyncio.sleep(3600)
+
+        agent.register_task_handler("slow", hang)
+        running, queued = make_task("slow"), make_task("slow")
+        queued.id = "slow-queued"
+        first = asyncio.create_task(agent.execute_task(running))
+        second = asyncio.create_task(agent.execute_task(queued))
+        await asyncio.sleep(0)
+
+        second.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await second
+
+        assert queued.status == TaskStatus.CANCELLED
+        assert list(agent._running_tasks) == [running.id]
+        assert list(agent._active_tasks) == [running.id]
+        first.cancel()
+        await asyncio.gather(first, return_exceptions=True)
+        assert not agent._running_tasks and not agent._active_tasks
+        await agent.shutdown()
+
+
+@pytest.mark.asyncio
+class TestOrchestrator:
+    """Test plan execution."""
+
+    async def test_dependency_chain_executes_in_order(self):
+        """Test that a dependent task only runs after its dependency."""
+        agent = EchoAgent(batch_max_wait_ms=1)
+        await agent.initialize()
+        orchestrator = Orchestrator()
+        orchestrator.register_agent(agent, ["echo"])
+
+        first, second = make_task("first", 1), make_task("second", 2)
+        plan = TaskPlan(tasks=[second, first], dependencies={"second": ["first"]})
+        results = await orchestrator.execute(plan)
+
+        assert results["first"].success and results["second"].success
+        assert first.completed_at <= second.started_at
+        await agent.shutdown()
+
+    async def test_cycle_reports_deadlock(self):
+        """Test that cyclic dependencies fail instead of hanging."""
+        orchestrator = Orchestrator()
+        plan = TaskPlan(
+            tasks=[make_task("a"), make_task("b")],
+            dependencies={"a": ["b"], "b": ["a"]},
+        )
+
+        results = await orchestrator.execute(plan)
+
+        assert results["a"].error == "Dependency deadlock"
+        assert results["b"].error == "Dependency deadlock"
+
+    async def test_critical_path_priority(self):
+        """Test that tasks heading longer chains get higher priority."""
+        orchestrator = Orchestrator()
+        plan = TaskPlan(
+            tasks=[make_task("leaf"), make_task("head"), make_task("tail")],
+            dependencies={"tail": ["head"]},
+        )
+
+        order, priority = orchestrator._compute_schedule(plan)
+
+        assert order.index("head") < order.index("tail")
+        assert priority["head"] > priority["leaf"]
+
+    async def test_capability_index_prefers_least_loaded(self):
+        """Test that agents are found by capability and ordered by load."""
+        orchestrator = Orchestrator()
+        first, second = EchoAgent(), EchoAgent()
+        orchestrator.register_agent(first, ["echo", "extra"])
+        orchestrator.register_agent(second, ["echo"])
+        orchestrator._agent_load[first.id] = 2
+
+        assert orchestrator.find_agents_for_task(["echo"]) == [second.id, first.id]
+        assert orchestrator.find_agents_for_task(["echo", "extra"]) == [first.id]
+
+        orchestrator.unregister_agent(first.id)
+        assert orchestrator.find_agents_for_task(["extra"]) == []
+
+    async def test_register_agent_defaults_to_agent_capabilities(self):
+        """Test that an agent registered without a list uses its own capabilities."""
+        orchestrator = Orchestrator()
+        agent = EchoAgent()
+        orchestrator.register_agent(agent)
+
+        assert agent.capability_names == frozenset({"echo"})
+        assert orchestrator.find_agents_for_task(["echo"]) == [agent.id]
+
+    async def test_context_is_bound_while_agents_run(self):
+        """Test that the plan context is visible through Context.current()."""
+        seen = []
+
+        async def agent(input_data):
+            seen.append(Context.current())
+            return input_data
+
+        orchestrator = Orchestrator()
+        orchestrator.register_agent(agent, ["echo"])
+        ctx = Context(request_id="req-1")
+
+        results = await orchestrator.execute(TaskPlan(tasks=[make_task("t", 1)]), context=ctx)
+
+        assert results["t"].success
+        assert seen == [ctx]
+        assert Context.current() is not ctx
+
+    async def test_create_plan_reuses_template(self):
+        """Test that repeated plans share a template but get fresh tasks."""
+        orchestrator = Orchestrator()
+        caps = ["research", "write"]
+
+        first = await orchestrator.create_plan("goal", caps)
+        second = await orchestrator.create_plan("goal", caps)
+
+        assert {t.id for t in first.tasks}.isdisjoint(t.id for t in second.tasks)
+        assert [t.name for t in first.tasks] == [t.name for t in second.tasks]
+        assert second.dependencies == {second.tasks[1].id: [second.tasks[0].id]}
+        assert list(second.priority.values()) == list(first.priority.values())
+        assert len(orchestrator._plan_templates) == 1
+
+    async def test_scheduler_error_is_raised_instead_of_hanging(self):
+        """Test that a failing plan ends the result stream with its error."""
+        async def agent(input_data):
+            return input_data
+
+        async def on_progress(task_id, result):
+            raise RuntimeError("progress sink down")
+
+        orchestrator = Orchestrator()
+        orchestrator.register_agent(agent, ["echo"])
+
+        with pytest.raises(RuntimeError, match="progress sink down"):
+            await asyncio.wait_for(
+                orchestrator.execute(TaskPlan(tasks=[make_task("t")]), on_progress=on_progress),
+                timeout=2,
+            )
+
+    async def test_dependencies_outside_the_plan(self):
+        """Test that unknown task ids in dependencies do not break scheduling."""
+        async def agent(input_data):
+            return input_data
+
+        orchestrator = Orchestrator()
+        orchestrator.register_agent(agent, ["echo"])
+        plan = TaskPlan(
+            tasks=[make_task("t1"), make_task("t2")],
+            dependencies={"ghost": ["t1"], "t2": ["ghost"]},
+        )
+
+        results = await asyncio.wait_for(orchestrator.execute(plan), timeout=2)
+
+        assert results["t1"].success
+        assert results["t2"].error == "Dependency deadlock"
+
+    async def test_failed_plan_releases_concurrency_slots(self):
+        """Test that an aborted plan does not starve later plans of slots."""
+        async def agent(input_data):
+            return input_data
+
+        async def on_progress(task_id, result):
+            raise RuntimeError("progress sink down")
+
+        orchestrator = Orchestrator(max_concurrent_tasks=1)
+        orchestrator.register_agent(agent, ["echo"])
+        failing = TaskPlan(tasks=[make_task("a"), make_task("b")])
+
+        with pytest.raises(RuntimeError, match="progress sink down"):
+            await asyncio.wait_for(
+                orchestrator.execute(failing, on_progress=on_progress), timeout=2
+            )
+        results = await asyncio.wait_for(
+            orchestrator.execute(TaskPlan(tasks=[make_task("c"), make_task("d")])), timeout=2
+        )
+
+        assert results["c"].success and results["d"].success
+        assert not orchestrator._semaphore.locked()
+
+    async def test_failing_agent_is_reported_per_task(self):
+        """Test that an agent error fails its task without aborting the plan."""
+        async def agent(input_data):
+            if input_data == "fail":
+                raise RuntimeError("boom")
+            return input_data
+
+        orchestrator = Orchestrator()
+        orchestrator.register_agent(agent, ["echo"])
+        plan = TaskPlan(tasks=[make_task("bad", "fail"), make_task("ok", 1)])
+
+        results = await orchestrator.execute(plan)
+
+        assert not results["bad"].success
+        assert results["bad"].error == "All agents failed to execute task"
+        assert results["ok"].success and results["ok"].output == 1
+
+    async def test_early_exit_cancels_remaining_tasks(self):
+        """Test that leaving iter_execute cancels running tasks and frees slots."""
+        cancelled = []
+
+        async def agent(input_data):
+            if input_data == "slow":
+                try:
+                    await asyncio.sleep(3600)
+                except asyncio.CancelledError:
+                    cancelled.append(input_data)
+                    raise
+            return input_data
+
+        orchestrator = Orchestrator(max_concurrent_tasks=2)
+        orchestrator.register_agent(agent, ["echo"])
+        plan = TaskPlan(tasks=[make_task("slow", "slow"), make_task("fast", "fast")])
+
+        async with contextlib.aclosing(orchestrator.iter_execute(plan)) as results:
+            async for result in results:
+                assert result.task_id == "fast"
+                break
+
+        assert cancelled == ["slow"]
+        assert orchestrator._semaphore._value == 2
+
+    async def test_cancelled_execute_frees_slots(self):
+        """Test that cancelling execute() releases the slots its tasks held."""
+        async def agent(input_data):
+            await asyncio.sleep(3600)
+
+        orchestrator = Orchestrator(max_concurrent_tasks=1)
+        orchestrator.register_agent(agent, ["echo"])
+        plan = TaskPlan(tasks=[make_task("a"), make_task("b")])
+
+        running = asyncio.create_task(orchestrator.execute(plan))
+        await asyncio.sleep(0.01)
+        running.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await running
+        assert orchestrator._semaphore._value == 1
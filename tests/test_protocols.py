@@ -171,6 +171,27 @@ class TestA2AProtocolIntegration:
         
         assert a2a.agent_card.name == "test-agent"
 
+    async def test_clients_release_shared_transport(self):
+        """Test that the shared pool closes when its last client disconnects."""
+        from agent_infrastructure_platform.protocols import http
+        from agent_infrastructure_platform.protocols.a2a.protocol import A2AProtocol
+        from agent_infrastructure_platform.protocols.a2a.types import AgentCard
+        from agent_infrastructure_platform.protocols.anp.protocol import ANPProtocol
+        
+        loop = asyncio.get_running_loop()
+        a2a = A2AProtocol(agent_card=AgentCard(name="test-agent", url="http://localhost:8000"))
+        anp = ANPProtocol()
+        
+        await a2a.connect()
+        await anp.connect()
+        assert a2a._transport is anp._transport
+        
+        await a2a.disconnect()
+        assert http._transports[loop].users == 1
+        
+        await anp.disconnect()
+        assert loop not in http._transports
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])